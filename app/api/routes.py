@@ -104,23 +104,9 @@ async def parse_schedule(
         )
 
     try:
-        file_bytes = await file.read()
-    except Exception as e:
-        return JSONResponse(
-            status_code=400,
-            content=ErrorResponse(
-                error="Failed to read upload",
-                detail=f"{type(e).__name__}: {e}",
-            ).model_dump(),
-        )
-    finally:
-        try:
-            await file.close()
-        except Exception:
-            pass
-
-    try:
-        wb = load_workbook_safe(file_bytes)
+        # The upload is already spooled by the multipart parser; load straight
+        # from that file instead of reading a second in-memory copy
+        wb = load_workbook_safe(file.file)
         schedule_sheets = get_schedule_sheets(wb)
         parsed = parse_workbook(wb, filename=file.filename)
 
@@ -149,3 +135,8 @@ async def parse_schedule(
                 detail=f"{type(e).__name__}: {e}",
             ).model_dump(),
         )
+    finally:
+        try:
+            await file.close()
+        except Exception:
+            pass
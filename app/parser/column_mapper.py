@@ -7,6 +7,7 @@ Key functions:
 - map_columns: Map header row columns to canonical names
 """
 
+import functools
 import re
 from difflib import SequenceMatcher
 from typing import TYPE_CHECKING
@@ -266,7 +267,17 @@ COLUMN_SYNONYMS: dict[str, list[str]] = {
 # Minimum similarity ratio for fuzzy matching (0.0 to 1.0)
 FUZZY_MATCH_THRESHOLD = 0.75
 
+# Number of canonical columns a header row can map to
+_TARGET_COUNT = len(COLUMN_SYNONYMS)
 
+# Normalized headers that mark a dedicated room/location column
+_ROOM_OR_LOCATION_HEADERS = frozenset(
+    {"room", "location", "item & location", "item and location", "item/location"}
+)
+
+
+# typed=True: 1, 1.0 and True hash equal but normalize to different strings
+@functools.lru_cache(maxsize=4096, typed=True)
 def _normalize_header(text: str | None) -> str:
     """Normalize header text for comparison.
     
@@ -309,7 +320,27 @@ for canonical, synonyms in COLUMN_SYNONYMS.items():
         if normalized_synonym:
             _COLUMN_LOOKUP[normalized_synonym] = canonical
 
+# Flattened (synonym, canonical) candidates for fuzzy matching
+_FUZZY_CANDIDATES: tuple[tuple[str, str], ...] = tuple(_COLUMN_LOOKUP.items())
+
+# Partial-match candidates, longest synonym first to prefer more specific matches.
+# Very short synonyms are skipped to avoid false positives.
+_PARTIAL_CANDIDATES: tuple[tuple[str, str], ...] = tuple(
+    (synonym, canonical)
+    for synonym, canonical in sorted(_COLUMN_LOOKUP.items(), key=lambda x: len(x[0]), reverse=True)
+    if len(synonym) >= 3
+)
+_PARTIAL_PRIORITY: dict[str, int] = {
+    synonym: index for index, (synonym, _) in enumerate(_PARTIAL_CANDIDATES)
+}
+_PARTIAL_ALTERNATION = '|'.join(re.escape(synonym) for synonym, _ in _PARTIAL_CANDIDATES)
+# Synonym at the start of the text, not followed by a letter or digit
+_PARTIAL_PREFIX_RE = re.compile(r'(?:' + _PARTIAL_ALTERNATION + r')(?![^\W_])')
+# Synonym as a complete phrase at any position (zero-width so matches may overlap)
+_PARTIAL_PHRASE_RE = re.compile(r'(?=\b(' + _PARTIAL_ALTERNATION + r')\b)')
 
+
+@functools.lru_cache(maxsize=4096)
 def _exact_match(text: str) -> str | None:
     """Try to find an exact match for the header text.
     
@@ -323,40 +354,36 @@ def _exact_match(text: str) -> str | None:
         return None
     
     # Direct lookup
-    if text in _COLUMN_LOOKUP:
-        return _COLUMN_LOOKUP[text]
+    canonical = _COLUMN_LOOKUP.get(text)
+    if canonical is not None:
+        return canonical
     
     # Try partial matching for compound headers
     # e.g., "item & location (see notes)" should match "item & location"
     # But be careful not to match too broadly (e.g., "code" in "fabric code")
     
-    # Sort synonyms by length (longest first) to prefer more specific matches
-    sorted_synonyms = sorted(_COLUMN_LOOKUP.items(), key=lambda x: len(x[0]), reverse=True)
+    # Collect every synonym found as a complete phrase (word boundary check
+    # avoids matching "code" in "fabric code"), plus a leading synonym that
+    # is not cut off in the middle of a word
+    found = _PARTIAL_PHRASE_RE.findall(text)
+    prefix = _PARTIAL_PREFIX_RE.match(text)
+    if prefix:
+        found.append(prefix.group())
     
-    for synonym, canonical in sorted_synonyms:
-        # Skip very short synonyms for partial matching to avoid false positives
-        if len(synonym) < 3:
-            continue
-            
-        # Check if text starts with the synonym
-        if text.startswith(synonym):
-            # Make sure it's a word boundary (not in the middle of a word)
-            if len(text) == len(synonym) or not text[len(synonym)].isalnum():
-                return canonical
-        
-        # Check if synonym is contained in text as a complete phrase
-        # Use word boundary check to avoid matching "code" in "fabric code"
-        pattern = r'\b' + re.escape(synonym) + r'\b'
-        if re.search(pattern, text):
-            return canonical
+    if not found:
+        return None
     
-    return None
+    # The longest (highest priority) synonym wins
+    return _COLUMN_LOOKUP[min(found, key=_PARTIAL_PRIORITY.__getitem__)]
 
 
+@functools.lru_cache(maxsize=4096)
 def _fuzzy_match(text: str, threshold: float = FUZZY_MATCH_THRESHOLD) -> tuple[str | None, float]:
     """Try to find a fuzzy match for the header text.
     
-    Uses difflib.SequenceMatcher to find the best matching synonym.
+    Uses difflib.SequenceMatcher to find the best matching synonym. One
+    matcher object is reused across candidates (set_seq2 still re-indexes each
+    synonym), and candidates whose quick upper bounds rule them out are skipped.
     
     Args:
         text: Normalized header text
@@ -371,10 +398,22 @@ def _fuzzy_match(text: str, threshold: float = FUZZY_MATCH_THRESHOLD) -> tuple[s
     
     best_match: str | None = None
     best_ratio = 0.0
+    matcher = SequenceMatcher(None, text)
     
-    for synonym, canonical in _COLUMN_LOOKUP.items():
+    for synonym, canonical in _FUZZY_CANDIDATES:
+        matcher.set_seq2(synonym)
+        
+        # Cheap upper bounds on ratio(): skip candidates that can neither reach
+        # the threshold nor beat the current best
+        bound = matcher.real_quick_ratio()
+        if bound < threshold or bound <= best_ratio:
+            continue
+        bound = matcher.quick_ratio()
+        if bound < threshold or bound <= best_ratio:
+            continue
+        
         # Calculate similarity ratio
-        ratio = SequenceMatcher(None, text, synonym).ratio()
+        ratio = matcher.ratio()
         
         if ratio > best_ratio:
             best_ratio = ratio
@@ -419,6 +458,13 @@ def _match_column(text: str, use_fuzzy: bool = True) -> tuple[str | None, str]:
     return None, 'none'
 
 
+def _read_header_values(ws: "Worksheet", header_row: int, max_cols: int) -> tuple:
+    """Read the first max_cols values of the header row in one pass."""
+    for values in ws.iter_rows(min_row=header_row, max_row=header_row, max_col=max_cols, values_only=True):
+        return values
+    return ()
+
+
 def map_columns(
     ws: "Worksheet",
     header_row: int,
@@ -454,8 +500,7 @@ def map_columns(
     actual_max = min(max_cols, ws.max_column or 1)
 
     normalized_headers: dict[int, str] = {}
-    for col in range(1, actual_max + 1):
-        value = ws.cell(row=header_row, column=col).value
+    for col, value in enumerate(_read_header_values(ws, header_row, actual_max), start=1):
         if value is None:
             continue
         normalized = _normalize_header(value)
@@ -465,10 +510,7 @@ def map_columns(
     # Heuristic: "DESCRIPTION" is ambiguous in the wild and in synthetic schedules.
     # If we already have a dedicated room/location column, then DESCRIPTION tends to
     # be the product name/description field rather than the location field.
-    has_room_or_location = any(
-        header in {"room", "location", "item & location", "item and location", "item/location"}
-        for header in normalized_headers.values()
-    )
+    has_room_or_location = not _ROOM_OR_LOCATION_HEADERS.isdisjoint(normalized_headers.values())
 
     # Pre-scan to check if any header matches product_name (using the same fuzzy
     # setting as the main scan). This prevents the DESCRIPTION heuristic from
@@ -478,17 +520,15 @@ def map_columns(
         for header in normalized_headers.values()
     )
 
+    # Only apply DESCRIPTION→product_name heuristic if no explicit product_name header exists
+    description_is_product_name = has_room_or_location and not has_explicit_product_name
+
     for col in range(1, actual_max + 1):
         normalized = normalized_headers.get(col)
         if not normalized:
             continue
 
-        # Only apply DESCRIPTION→product_name heuristic if no explicit product_name header exists
-        if (
-            normalized == "description"
-            and has_room_or_location
-            and not has_explicit_product_name
-        ):
+        if normalized == "description" and description_is_product_name:
             columns["product_name"] = col
             continue
 
@@ -496,6 +536,10 @@ def map_columns(
         if canonical and canonical not in columns:
             # Only store first occurrence of each canonical name
             columns[canonical] = col
+            # Every canonical column is bound; later headers can only be ignored
+            # (unless a later DESCRIPTION may still rebind product_name)
+            if len(columns) == _TARGET_COUNT and not description_is_product_name:
+                break
 
     return columns
 
@@ -536,9 +580,10 @@ def get_column_mapping_details(
     # Determine actual column range to scan
     actual_max = min(max_cols, ws.max_column or 1)
     
+    values = _read_header_values(ws, header_row, actual_max)
+    
     for col in range(1, actual_max + 1):
-        cell = ws.cell(row=header_row, column=col)
-        value = cell.value
+        value = values[col - 1] if col <= len(values) else None
         
         original = str(value) if value is not None else None
         normalized = _normalize_header(value)
@@ -709,11 +709,11 @@ def extract_product_fields(
     detail_dim_text = build_dimension_text(detail_kv)
     specs_dim_text = build_dimension_text(kv_specs)
 
-    detail_dims = parse_dimensions(detail_dim_text) if detail_dim_text else {"width": None, "length": None, "height": None}
-    specs_dims = parse_dimensions(specs_dim_text) if specs_dim_text else {"width": None, "length": None, "height": None}
-    width = _parse_mm_cell(row_data.get('width')) or detail_dims.get("width") or specs_dims.get("width")
-    length = _parse_mm_cell(row_data.get('length')) or detail_dims.get("length") or specs_dims.get("length")
-    height = _parse_mm_cell(row_data.get('height')) or detail_dims.get("height") or specs_dims.get("height")
+    detail_dims = parse_dimensions(detail_dim_text)
+    specs_dims = parse_dimensions(specs_dim_text)
+    width = _parse_mm_cell(row_data.get('width')) or detail_dims.width or specs_dims.width
+    length = _parse_mm_cell(row_data.get('length')) or detail_dims.length or specs_dims.length
+    height = _parse_mm_cell(row_data.get('height')) or detail_dims.height or specs_dims.height
 
     qty = _parse_qty(row_data.get('qty'))
     rrp = _parse_numeric_price(row_data.get('cost'))
@@ -777,7 +777,9 @@ def extract_product_fields(
 
     product_details = ' | '.join(details_parts) if details_parts else None
 
-    return Product(
+    # Every value above is already a str/int/float of the declared type (numeric
+    # parsers reject negatives), so skip pydantic re-validation on this hot path.
+    return Product.model_construct(
         doc_code=doc_code,
         product_name=product_name,
         brand=brand,
@@ -5,16 +5,98 @@ This module provides parsing/normalization helpers for messy schedule text.
 
 from __future__ import annotations
 
+import functools
+import platform
 import re
+from typing import Any, Callable, NamedTuple, TypeVar
 
 
-_UNIT_RE = r'(?:mm|millimet(?:er|re)s?|cm|centimet(?:er|re)s?|m|met(?:er|re)s?|in|inch(?:es)?|")'
+# Memoization for the pure string parsers below. PyPy's lru_cache is implemented
+# in Python and its JIT already handles these small functions well, so caching
+# is only enabled on CPython.
+_F = TypeVar("_F", bound=Callable[..., Any])
 
-_UNIT_PATTERN = re.compile(
-    rf'^(?P<num>\d+(?:[.,]\d+)?)\s*(?P<unit>{_UNIT_RE})?$',
-    re.IGNORECASE,
+if platform.python_implementation() == "PyPy":
+    def _memoize(func: _F) -> _F:
+        return func
+else:
+    _memoize = functools.lru_cache(maxsize=4096)
+
+# Dimension text is upper-cased once before matching, so the patterns below are
+# written with uppercase literals and compiled without re.IGNORECASE.
+_UNIT_RE = r'(?:MM|MILLIMET(?:ER|RE)S?|CM|CENTIMET(?:ER|RE)S?|M|MET(?:ER|RE)S?|IN|INCH(?:ES)?|")'
+
+# Metric-only unit group used by the multi-dimension patterns.
+_METRIC_UNIT_RE = r'(MM|MILLIMET(?:ER|RE)S?|CM|CENTIMET(?:ER|RE)S?|M|MET(?:ER|RE)S?)'
+
+_NUM_RE = r'(\d+(?:[.,]\d+)?)'
+
+_UNIT_PATTERN = re.compile(rf'^(?P<num>\d+(?:[.,]\d+)?)\s*(?P<unit>{_UNIT_RE})?$', re.ASCII)
+
+# Glued forms like "10MM" or `3.9"`
+_GLUED_RE = re.compile(r'^(\d+(?:[.,]\d+)?)(MM|CM|M|"|IN)$', re.ASCII)
+
+# Number+unit inside a larger string. (?!\w) instead of \b handles the inch
+# symbol ("), which is a non-word char.
+_INNER_UNIT_RE = re.compile(rf'{_NUM_RE}\s*({_UNIT_RE})(?!\w)', re.ASCII)
+_INNER_NUM_RE = re.compile(_NUM_RE, re.ASCII)
+
+# Pattern 1: explicit keys, e.g. "WIDTH: 600 MM". All keys share one
+# alternation so the text is scanned once rather than once per key.
+_EXPLICIT_KEYS_RE = re.compile(
+    rf'\b(WIDTH|LENGTH|HEIGHT|DEPTH|THICKNESS)\b\s*[:=\-]?\s*([0-9]+(?:[.,][0-9]+)?\s*(?:{_UNIT_RE})?)',
+    re.ASCII,
 )
 
+# Pattern 2: labeled blocks, e.g. "220 W X 2200 L MM" (optionally 3-part)
+_LABELED_RE = re.compile(
+    rf'{_NUM_RE}\s*([WLHDT])\s*X\s*{_NUM_RE}\s*([WLHDT])(?:\s*X\s*{_NUM_RE}\s*([WLHDT]))?\s*{_METRIC_UNIT_RE}?\b',
+    re.ASCII,
+)
+
+# Pattern 2b: parenthesized labels, e.g. "1200 (W) x 800 (D) x 330 (H) mm"
+_PAREN_LABELED_RE = re.compile(
+    rf'{_NUM_RE}\s*\(([WLHDT])\)\s*X\s*{_NUM_RE}\s*\(([WLHDT])\)(?:\s*X\s*{_NUM_RE}\s*\(([WLHDT])\))?\s*{_METRIC_UNIT_RE}?\b',
+    re.ASCII,
+)
+
+# Pattern 3: unlabeled "A X B (X C) MM"
+_UNLABELED_RE = re.compile(
+    rf'{_NUM_RE}\s*X\s*{_NUM_RE}(?:\s*X\s*{_NUM_RE})?\s*{_METRIC_UNIT_RE}\b',
+    re.ASCII,
+)
+
+# Pattern 4: standalone number with unit, e.g. "3.66 METRES"
+_STANDALONE_RE = re.compile(rf'^([0-9]+(?:[.,][0-9]+)?)\s*{_METRIC_UNIT_RE}$', re.ASCII)
+
+# Millimetres per (lowercased) unit token.
+_MM_PER_UNIT: dict[str, float] = {
+    **dict.fromkeys(("mm", "millimeter", "millimeters", "millimetre", "millimetres"), 1),
+    **dict.fromkeys(("cm", "centimeter", "centimeters", "centimetre", "centimetres"), 10),
+    **dict.fromkeys(("m", "meter", "meters", "metre", "metres"), 1000),
+    **dict.fromkeys(("in", "inch", "inches", '"'), 25.4),
+}
+
+# Non-breaking spaces and fullwidth digits seen in pasted schedule text. Mapped
+# in a single str.translate pass before any pattern matching (the patterns are
+# compiled with re.ASCII).
+_NORMALIZE_TABLE = str.maketrans({
+    "\u00a0": " ",
+    **{chr(0xFF10 + digit): str(digit) for digit in range(10)},
+})
+
+# parse_dimensions also folds multiplication-sign look-alikes into its "X"
+# separator. Kept out of _NORMALIZE_TABLE: turning "×" into a word character
+# would break the (?!\w) and \b boundaries in the single-value parsers.
+_DIMS_NORMALIZE_TABLE = str.maketrans({
+    "×": "X",
+    "✕": "X",
+    "⨯": "X",
+    "Ｘ": "X",
+    "\u00a0": " ",
+    **{chr(0xFF10 + digit): str(digit) for digit in range(10)},
+})
+
 
 def _to_mm(value: str, unit: str | None) -> int | None:
     value = value.strip().replace(',', '.')
@@ -29,41 +111,28 @@ def _to_mm(value: str, unit: str | None) -> int | None:
     if not unit:
         return int(round(number))
 
-    unit_norm = unit.strip().lower()
-    if unit_norm in {"mm", "millimeter", "millimeters", "millimetre", "millimetres"}:
-        return int(round(number))
-    if unit_norm in {"cm", "centimeter", "centimeters", "centimetre", "centimetres"}:
-        return int(round(number * 10))
-    if unit_norm in {"m", "meter", "meters", "metre", "metres"}:
-        return int(round(number * 1000))
-    if unit_norm in {"in", "inch", "inches", '"'}:
-        return int(round(number * 25.4))
-
-    return None
+    factor = _MM_PER_UNIT.get(unit.strip().lower())
+    if factor is None:
+        return None
+    return int(round(number * factor))
 
 
 def _parse_number_with_unit(text: str) -> int | None:
-    text = text.strip()
+    text = text.strip().upper()
     if not text:
         return None
 
-    # Handle glued forms like "10MM" or `3.9"`
-    glued = re.match(r'^(\d+(?:[.,]\d+)?)(mm|cm|m|"|in)$', text, re.IGNORECASE)
+    glued = _GLUED_RE.match(text)
     if glued:
         return _to_mm(glued.group(1), glued.group(2))
 
     match = _UNIT_PATTERN.match(text)
     if not match:
         # Try to salvage a number+unit from within larger strings.
-        # Use (?!\w) instead of \b to handle inch symbol (") which is non-word char
-        inner = re.search(
-            rf'(\d+(?:[.,]\d+)?)\s*({_UNIT_RE})(?!\w)',
-            text,
-            re.IGNORECASE,
-        )
+        inner = _INNER_UNIT_RE.search(text)
         if inner:
             return _to_mm(inner.group(1), inner.group(2))
-        inner_num = re.search(r'(\d+(?:[.,]\d+)?)', text)
+        inner_num = _INNER_NUM_RE.search(text)
         if inner_num:
             return _to_mm(inner_num.group(1), None)
         return None
@@ -71,6 +140,7 @@ def _parse_number_with_unit(text: str) -> int | None:
     return _to_mm(match.group("num"), match.group("unit"))
 
 
+@_memoize
 def parse_mm_value(text: str | None) -> int | None:
     """Parse a single numeric value with an optional unit into mm.
 
@@ -78,10 +148,57 @@ def parse_mm_value(text: str | None) -> int | None:
     """
     if not text:
         return None
-    return _parse_number_with_unit(str(text))
+    return _parse_number_with_unit(str(text).translate(_NORMALIZE_TABLE))
+
+
+class Dims(NamedTuple):
+    """Parsed dimensions in millimetres (None when not found)."""
+
+    width: int | None
+    length: int | None
+    height: int | None
+
+
+_EMPTY_DIMS = Dims(None, None, None)
 
 
-def parse_dimensions(text: str | None) -> dict[str, int | None]:
+def _apply_labeled_match(
+    match: re.Match[str],
+    width: int | None,
+    length: int | None,
+    height: int | None,
+) -> tuple[int | None, int | None, int | None]:
+    """Fill missing dims from a _LABELED_RE / _PAREN_LABELED_RE match.
+
+    Match groups are (num, label) x3 followed by the unit. W maps to width,
+    L/D to length and H/T to height; fields that are already set are kept.
+    """
+    unit = match.group(7)
+    for num, label in (
+        (match.group(1), match.group(2)),
+        (match.group(3), match.group(4)),
+        (match.group(5), match.group(6)),
+    ):
+        if not num or not label:
+            continue
+        mm = _to_mm(num, unit)
+        if mm is None:
+            continue
+        if label == "W":
+            if width is None:
+                width = mm
+        elif label == "L" or label == "D":
+            # D (Depth) maps to length for labeled dimensions
+            if length is None:
+                length = mm
+        elif height is None:
+            # H or T
+            height = mm
+    return width, length, height
+
+
+@_memoize
+def parse_dimensions(text: str | None) -> Dims:
     """Parse dimension text into width/length/height (mm).
 
     Supports the patterns listed in TASKS.md (3.5):
@@ -100,117 +217,71 @@ def parse_dimensions(text: str | None) -> dict[str, int | None]:
         text: Raw dimension text (may contain additional words)
 
     Returns:
-        Dict with keys: width, length, height (int mm or None)
+        Dims named tuple (width, length, height), each int mm or None.
     """
-    result: dict[str, int | None] = {"width": None, "length": None, "height": None}
     if not text:
-        return result
+        return _EMPTY_DIMS
 
-    normalized = str(text).replace("×", "X")
+    width: int | None = None
+    length: int | None = None
+    height: int | None = None
 
-    # Pattern 1: explicit keys
+    normalized = str(text).translate(_DIMS_NORMALIZE_TABLE).upper()
+
+    # Pattern 1: explicit keys (first occurrence of each key wins)
     explicit: dict[str, int | None] = {}
-    for key in ("WIDTH", "LENGTH", "HEIGHT", "DEPTH", "THICKNESS"):
-        match = re.search(
-            rf'\b{key}\b\s*[:=\-]?\s*([0-9]+(?:[.,][0-9]+)?\s*(?:{_UNIT_RE})?)',
-            normalized,
-            re.IGNORECASE,
-        )
-        if not match:
+    seen_keys: set[str] = set()
+    for match in _EXPLICIT_KEYS_RE.finditer(normalized):
+        key = match.group(1)
+        if key in seen_keys:
             continue
-        value_mm = _parse_number_with_unit(match.group(1))
+        seen_keys.add(key)
+        value_mm = _parse_number_with_unit(match.group(2))
         if value_mm is None:
             continue
-        explicit[key.upper()] = value_mm
+        explicit[key] = value_mm
 
-    if "WIDTH" in explicit:
-        result["width"] = explicit["WIDTH"]
-    if "LENGTH" in explicit:
-        result["length"] = explicit["LENGTH"]
+    width = explicit.get("WIDTH")
+    length = explicit.get("LENGTH")
 
     thickness_mm = explicit.get("THICKNESS")
 
     if "HEIGHT" in explicit:
-        result["height"] = explicit["HEIGHT"]
+        height = explicit["HEIGHT"]
     elif "DEPTH" in explicit:
-        result["height"] = explicit["DEPTH"]
+        height = explicit["DEPTH"]
     # Do not set height from THICKNESS yet. Some schedules include both SIZE
     # (e.g., "600 W X 600 H") and THICKNESS (e.g., "10mm"). Prefer the size's
     # H dimension when present and only fall back to thickness if no other
     # height-like dimension is found.
 
+    # Fully specified by explicit keys: the remaining patterns only fill gaps.
+    if width is not None and length is not None and height is not None:
+        return Dims(width, length, height)
+
     # Pattern 2: labeled blocks like "220 W X 2200 L MM" (optionally 3-part)
     # Prefer this only for missing fields so explicit keys win.
-    labeled = re.search(
-        r'(\d+(?:[.,]\d+)?)\s*([WLHDT])\s*X\s*(\d+(?:[.,]\d+)?)\s*([WLHDT])(?:\s*X\s*(\d+(?:[.,]\d+)?)\s*([WLHDT]))?\s*(mm|millimet(?:er|re)s?|cm|centimet(?:er|re)s?|m|met(?:er|re)s?)?\b',
-        normalized,
-        re.IGNORECASE,
-    )
+    labeled = _LABELED_RE.search(normalized)
     if labeled:
-        a_num, a_label, b_num, b_label = labeled.group(1), labeled.group(2), labeled.group(3), labeled.group(4)
-        c_num, c_label = labeled.group(5), labeled.group(6)
-        unit = labeled.group(7)
-
-        def set_labeled(num: str, label: str) -> None:
-            mm = _to_mm(num, unit)
-            if mm is None:
-                return
-            label_norm = label.upper()
-            if label_norm == "W" and result["width"] is None:
-                result["width"] = mm
-            elif label_norm in {"L", "D"} and result["length"] is None:
-                # D (Depth) maps to length for labeled dimensions
-                result["length"] = mm
-            elif label_norm in {"H", "T"} and result["height"] is None:
-                result["height"] = mm
-
-        set_labeled(a_num, a_label)
-        set_labeled(b_num, b_label)
-        if c_num and c_label:
-            set_labeled(c_num, c_label)
+        width, length, height = _apply_labeled_match(labeled, width, length, height)
+
+    if width is not None and length is not None and height is not None:
+        return Dims(width, length, height)
 
     # Pattern 2b: Parenthesized labels like "1200 (W) x 800 (D) x 330 (H) mm"
     # Match up to 3 dimensions with parenthesized labels
-    paren_labeled = re.search(
-        r'(\d+(?:[.,]\d+)?)\s*\(([WLHDT])\)\s*[Xx]\s*(\d+(?:[.,]\d+)?)\s*\(([WLHDT])\)(?:\s*[Xx]\s*(\d+(?:[.,]\d+)?)\s*\(([WLHDT])\))?\s*(mm|millimet(?:er|re)s?|cm|centimet(?:er|re)s?|m|met(?:er|re)s?)?\b',
-        normalized,
-        re.IGNORECASE,
-    )
+    # (cheap substring check first; most cells have no parentheses at all)
+    paren_labeled = "(" in normalized and _PAREN_LABELED_RE.search(normalized)
     if paren_labeled:
-        a_num, a_label = paren_labeled.group(1), paren_labeled.group(2)
-        b_num, b_label = paren_labeled.group(3), paren_labeled.group(4)
-        c_num, c_label = paren_labeled.group(5), paren_labeled.group(6)
-        unit = paren_labeled.group(7)
-
-        def set_paren_labeled(num: str, label: str) -> None:
-            mm = _to_mm(num, unit)
-            if mm is None:
-                return
-            label_norm = label.upper()
-            if label_norm == "W" and result["width"] is None:
-                result["width"] = mm
-            elif label_norm in {"L", "D"} and result["length"] is None:
-                # D (Depth) maps to length for furniture dimensions
-                result["length"] = mm
-            elif label_norm in {"H", "T"} and result["height"] is None:
-                result["height"] = mm
-
-        set_paren_labeled(a_num, a_label)
-        set_paren_labeled(b_num, b_label)
-        if c_num and c_label:
-            set_paren_labeled(c_num, c_label)
+        width, length, height = _apply_labeled_match(paren_labeled, width, length, height)
 
     # Pattern 3: unlabeled "A X B (X C) MM"
     # For 3-part patterns like "600 X 400 X 200 MM", interpret as width x length x height
     # For 2-part patterns:
     #   - If equal dimensions (600X600): interpret as width x height (common for square tiles)
     #   - If different dimensions (5500 X 2800): interpret as width x length (common for sheets)
-    if result["width"] is None or result["length"] is None or result["height"] is None:
-        unlabeled = re.search(
-            r'(\d+(?:[.,]\d+)?)\s*X\s*(\d+(?:[.,]\d+)?)(?:\s*X\s*(\d+(?:[.,]\d+)?))?\s*(mm|millimet(?:er|re)s?|cm|centimet(?:er|re)s?|m|met(?:er|re)s?)\b',
-            normalized,
-            re.IGNORECASE,
-        )
+    if width is None or length is None or height is None:
+        unlabeled = _UNLABELED_RE.search(normalized)
         if unlabeled:
             a_mm = _to_mm(unlabeled.group(1), unlabeled.group(4))
             b_mm = _to_mm(unlabeled.group(2), unlabeled.group(4))
@@ -218,65 +289,62 @@ def parse_dimensions(text: str | None) -> dict[str, int | None]:
 
             if c_mm is not None:
                 # 3-part: width x length x height
-                if result["width"] is None:
-                    result["width"] = a_mm
-                if result["length"] is None:
-                    result["length"] = b_mm
-                if result["height"] is None:
-                    result["height"] = c_mm
+                if width is None:
+                    width = a_mm
+                if length is None:
+                    length = b_mm
+                if height is None:
+                    height = c_mm
             else:
                 # 2-part: heuristic based on whether dimensions are equal
                 if a_mm == b_mm:
                     # Equal dimensions (square, like 600X600): width x height
-                    if result["width"] is None:
-                        result["width"] = a_mm
-                    if result["height"] is None:
-                        result["height"] = b_mm
+                    if width is None:
+                        width = a_mm
+                    if height is None:
+                        height = b_mm
                 else:
                     # Different dimensions (rectangular, like 5500 X 2800): width x length
-                    if result["width"] is None:
-                        result["width"] = a_mm
-                    if result["length"] is None:
-                        result["length"] = b_mm
+                    if width is None:
+                        width = a_mm
+                    if length is None:
+                        length = b_mm
 
     # Pattern 4: Standalone number with unit (for single dimension values like "3.66 METRES")
     # Only apply if no dimensions were found yet
-    if result["width"] is None and result["length"] is None and result["height"] is None:
-        standalone = re.search(
-            r'^([0-9]+(?:[.,][0-9]+)?)\s*(mm|millimet(?:er|re)s?|cm|centimet(?:er|re)s?|m|met(?:er|re)s?)$',
-            normalized.strip(),
-            re.IGNORECASE,
-        )
+    if width is None and length is None and height is None:
+        standalone = _STANDALONE_RE.search(normalized.strip())
         if standalone:
             mm = _to_mm(standalone.group(1), standalone.group(2))
             if mm is not None:
                 # For standalone values, assume width (most common single dimension)
-                result["width"] = mm
+                width = mm
 
-    if result["height"] is None and thickness_mm is not None:
-        result["height"] = thickness_mm
+    if height is None and thickness_mm is not None:
+        height = thickness_mm
 
-    return result
+    return Dims(width, length, height)
 
 
 _NON_NUMERIC_PRICE_PATTERN = re.compile(
     r'^\s*(?:tbc|tba|poa|n/?a|na|nil|-\s*)\s*$',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
 # First preference: explicit currency marker like "$25+GST" or "$45.50 PER SQM"
 _DOLLAR_AMOUNT_PATTERN = re.compile(
     r'\$\s*(?P<num>\d+(?:,\d{3})*(?:\.\d+)?)',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
 # Fallback: amount near a price context word (RRP/PRICE/COST) when "$" is absent.
 _CONTEXT_AMOUNT_PATTERN = re.compile(
     r'\b(?:rrp|price|cost|unit\s*cost|rate)\b[^\d$]{0,20}(?P<num>\d+(?:,\d{3})*(?:\.\d+)?)',
-    re.IGNORECASE,
+    re.IGNORECASE | re.ASCII,
 )
 
 
+@_memoize
 def parse_price(text: str | None) -> float | None:
     """Parse a unit price from messy schedule text.
 
@@ -294,7 +362,7 @@ def parse_price(text: str | None) -> float | None:
     if text is None:
         return None
 
-    raw = str(text).strip()
+    raw = str(text).translate(_NORMALIZE_TABLE).strip()
     if not raw:
         return None
 
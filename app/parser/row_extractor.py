@@ -10,7 +10,8 @@ Key functions:
 """
 
 import re
-from typing import TYPE_CHECKING, Iterator, Any
+from enum import Enum
+from typing import TYPE_CHECKING, Iterable, Iterator, Any, Literal, NamedTuple
 
 if TYPE_CHECKING:
     from openpyxl.worksheet.worksheet import Worksheet
@@ -64,26 +65,92 @@ SKIP_ROW_PATTERNS = [
     r'^tax$',
 ]
 
-# Compiled skip patterns
-_SKIP_PATTERNS = [re.compile(p, re.IGNORECASE) for p in SKIP_ROW_PATTERNS]
+# Skip patterns fused into a single compiled alternation
+_SKIP_RE = re.compile('|'.join(f'(?:{p})' for p in SKIP_ROW_PATTERNS), re.IGNORECASE)
 
+# Digits or a short uppercase prefix ("FCA-") suggest a doc code, not a section name
+_DOC_CODE_HINT_RE = re.compile(r'\d|^[A-Z]{1,3}-')
 
-def _get_cell_value(ws: "Worksheet", row: int, col: int) -> Any:
-    """Get cell value, handling None gracefully.
+# Normalized "Item:" key and immutable detail-key lookup used by the row scans
+_ITEM_KEY = 'item:'
+_DETAIL_KEYS_FROZEN = frozenset(DETAIL_ROW_KEYS)
+
+# Generic "key:" cell (3-24 chars ending in a colon) that may start a detail row
+_GENERIC_KEY_RE = re.compile(r'.{2,23}:', re.DOTALL)
+
+# Row classifiers only inspect the first nine columns
+_MAX_CHECKED_COL = 9
+
+# Leading columns checked by _is_empty_row
+_EMPTY_ROW_MAX_COLS = 20
+
+# Cell value types kept as-is by _extract_row_data (bool is an int subclass)
+_NUMERIC_TYPES = frozenset({int, float, bool})
+
+
+class _ScanColumns(NamedTuple):
+    """Column indices (1-indexed) the row classifiers read, resolved once per scan."""
+    
+    doc_code: int
+    specs: int | None
+    manufacturer: int | None
+    item_location: int | None
+    image: int | None
+    mapped: tuple[tuple[str, int], ...]  # col_map.items() snapshot for row extraction
+
+
+def _scan_columns(col_map: dict[str, int]) -> _ScanColumns:
+    """Resolve the classifier columns from a column mapping.
+    
+    Args:
+        col_map: Column mapping from map_columns()
+        
+    Returns:
+        _ScanColumns with doc_code defaulting to column 1
+    """
+    return _ScanColumns(
+        doc_code=col_map.get('doc_code', 1),
+        specs=col_map.get('specs'),
+        manufacturer=col_map.get('manufacturer'),
+        item_location=col_map.get('item_location'),
+        image=col_map.get('image'),
+        mapped=tuple(col_map.items()),
+    )
+
+
+def _materialize_rows(ws: "Worksheet", start: int, end: int, max_col: int) -> list[tuple[Any, ...]]:
+    """Read a block of rows as value tuples in a single iter_rows pass.
+    
+    Per-cell ws.cell() access is very slow in openpyxl; reading the rows once
+    and indexing into the tuples is orders of magnitude faster.
     
     Args:
         ws: Worksheet object
-        row: Row number (1-indexed)
+        start: First row number (1-indexed, inclusive)
+        end: Last row number (1-indexed, inclusive)
+        max_col: Number of columns to read per row
+    
+    Returns:
+        List of row tuples; index 0 is row `start`, tuple index 0 is column A
+    """
+    if end < start:
+        return []
+    return list(ws.iter_rows(min_row=start, max_row=end, max_col=max_col, values_only=True))
+
+
+def _row_value(values: tuple[Any, ...], col: int) -> Any:
+    """Get a value from a materialized row tuple.
+    
+    Args:
+        values: Row tuple from _materialize_rows()
         col: Column number (1-indexed)
-        
+    
     Returns:
-        Cell value or None
+        Cell value, or None if the column is outside the row
     """
-    try:
-        cell = ws.cell(row=row, column=col)
-        return cell.value
-    except (IndexError, AttributeError):
-        return None
+    if 0 < col <= len(values):
+        return values[col - 1]
+    return None
 
 
 def _normalize_text(value: Any) -> str:
@@ -100,38 +167,61 @@ def _normalize_text(value: Any) -> str:
     return str(value).strip().lower()
 
 
-def _is_empty_row(ws: "Worksheet", row: int, col_map: dict[str, int], max_cols: int = 20) -> bool:
+class _RowFeatures(NamedTuple):
+    """Text of a row's leading cells, derived once and shared by the row classifiers."""
+    
+    texts: tuple[str, ...]  # stripped text of the first _MAX_CHECKED_COL cells ('' for None)
+    norm: tuple[str, ...]  # texts lowercased, i.e. _normalize_text() of each cell
+
+
+def _row_features(values: tuple[Any, ...]) -> _RowFeatures:
+    """Compute the row features used by the row classifiers.
+    
+    Args:
+        values: Row tuple from _materialize_rows()
+        
+    Returns:
+        _RowFeatures for the first _MAX_CHECKED_COL cells
+    """
+    texts = tuple('' if v is None else str(v).strip() for v in values[:_MAX_CHECKED_COL])
+    return _RowFeatures(texts, tuple(text.lower() for text in texts))
+
+
+def _is_empty_row(values: tuple[Any, ...], col_map: dict[str, int], max_cols: int = _EMPTY_ROW_MAX_COLS) -> bool:
     """Check if a row is empty (no meaningful data in mapped columns).
     
     Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
+        values: Row tuple from _materialize_rows()
         col_map: Column mapping from map_columns()
         max_cols: Maximum columns to check
         
     Returns:
         True if row has no meaningful data
     """
-    # Check all mapped columns
-    for canonical, col in col_map.items():
-        value = _get_cell_value(ws, row, col)
-        if value is not None and str(value).strip():
-            return False
-    
-    # Also check first few columns in case col_map is incomplete
-    for col in range(1, min(max_cols, ws.max_column or 1) + 1):
-        value = _get_cell_value(ws, row, col)
-        if value is not None and str(value).strip():
-            return False
+    # Check the leading columns first; non-empty rows usually have data in
+    # column A, so this returns after the first cell. Only strings can be blank.
+    if any(
+        value is not None and (not isinstance(value, str) or value.strip())
+        for value in values[:max_cols]
+    ):
+        return False
+    
+    # Mapped columns beyond that prefix (map_columns scans up to 30 columns)
+    for col in col_map.values():
+        if col > max_cols:
+            value = _row_value(values, col)
+            if value is not None and str(value).strip():
+                return False
     
     return True
 
 
 def _is_section_header(
-    ws: "Worksheet",
-    row: int,
+    values: tuple[Any, ...],
     col_map: dict[str, int],
     doc_code_col: int | None = None,
+    cols: _ScanColumns | None = None,
+    features: _RowFeatures | None = None,
 ) -> tuple[bool, str | None]:
     """Check if a row is a section header (e.g., "FLOORING", "GLASS").
     
@@ -142,50 +232,51 @@ def _is_section_header(
     - No meaningful data in specs/manufacturer columns (or same value as column A)
     
     Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
+        values: Row tuple from _materialize_rows()
         col_map: Column mapping from map_columns()
         doc_code_col: Column index for doc_code (default: from col_map or 1)
+        cols: Precomputed _scan_columns(col_map), computed if omitted
+        features: Precomputed _row_features(values), computed if omitted
         
     Returns:
         Tuple of (is_section_header, section_name)
     """
+    if cols is None:
+        cols = _scan_columns(col_map)
     if doc_code_col is None:
-        doc_code_col = col_map.get('doc_code', 1)
+        doc_code_col = cols.doc_code
     
-    # Get value in first column (typically where section headers appear)
-    first_col_value = _get_cell_value(ws, row, 1)
-    
-    if first_col_value is None:
-        return False, None
+    if features is None:
+        features = _row_features(values)
+    texts = features.texts
     
-    first_col_text = str(first_col_value).strip()
+    # Get value in first column (typically where section headers appear)
+    first_col_text = texts[0] if texts else ''
     if not first_col_text:
         return False, None
     
     # After fill_merged_regions, merged cells have the same value in all cells
     # Check if multiple columns have the same value (indicates former merged cell)
     same_value_count = 0
-    for col in range(1, min(8, (ws.max_column or 1) + 1)):
-        col_value = _get_cell_value(ws, row, col)
-        if col_value is not None and str(col_value).strip() == first_col_text:
+    for text in texts[:7]:
+        if text == first_col_text:
             same_value_count += 1
-    
-    # If 3+ columns have the same value, it was likely a merged cell (section header)
-    if same_value_count >= 3:
-        return True, first_col_text
+            # If 3+ columns have the same value, it was likely a merged cell (section header)
+            if same_value_count >= 3:
+                return True, first_col_text
     
     # Also check for section headers that are all caps with no other meaningful data
     # These have text in column A but nothing different in other key columns
-    if first_col_text.isupper() and len(first_col_text) < 50:
-        specs_col = col_map.get('specs')
-        manufacturer_col = col_map.get('manufacturer')
-        item_location_col = col_map.get('item_location')
+    # (length first: it is O(1) and rules out long description cells before isupper scans them)
+    if len(first_col_text) < 50 and first_col_text.isupper():
+        specs_col = cols.specs
+        manufacturer_col = cols.manufacturer
+        item_location_col = cols.item_location
         
         # Get values from other columns
-        specs_value = specs_col and _get_cell_value(ws, row, specs_col)
-        manufacturer_value = manufacturer_col and _get_cell_value(ws, row, manufacturer_col)
-        item_location_value = item_location_col and _get_cell_value(ws, row, item_location_col)
+        specs_value = specs_col and _row_value(values, specs_col)
+        manufacturer_value = manufacturer_col and _row_value(values, manufacturer_col)
+        item_location_value = item_location_col and _row_value(values, item_location_col)
         
         # Check if other columns are empty or have the same value as column A
         specs_empty_or_same = not specs_value or str(specs_value).strip() == first_col_text
@@ -196,47 +287,56 @@ def _is_section_header(
         if specs_empty_or_same and manufacturer_empty_or_same and item_location_empty_or_same:
             # Additional check: section headers don't look like doc codes
             # Doc codes typically have numbers or specific patterns like "FCA-01"
-            if not re.search(r'\d', first_col_text) and not re.search(r'^[A-Z]{1,3}-', first_col_text):
+            if not _DOC_CODE_HINT_RE.search(first_col_text):
                 return True, first_col_text
     
     return False, None
 
 
-def _is_skip_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> bool:
+def _is_skip_row(
+    values: tuple[Any, ...],
+    col_map: dict[str, int],
+    features: _RowFeatures | None = None,
+    cols: _ScanColumns | None = None,
+) -> bool:
     """Check if a row should be skipped (delivery, totals, etc.).
     
     Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
+        values: Row tuple from _materialize_rows()
         col_map: Column mapping from map_columns()
+        features: Precomputed _row_features(values), computed if omitted
+        cols: Precomputed _scan_columns(col_map), computed if omitted
         
     Returns:
         True if row should be skipped
     """
+    if features is None:
+        features = _row_features(values)
+    norm = features.norm
+    
     # Check first few columns for skip patterns
-    for col in range(1, min(5, (ws.max_column or 1) + 1)):
-        value = _get_cell_value(ws, row, col)
-        if value is None:
-            continue
-        
-        text = _normalize_text(value)
-        for pattern in _SKIP_PATTERNS:
-            if pattern.match(text):
-                return True
+    for text in norm[:4]:
+        if text and _SKIP_RE.match(text):
+            return True
     
     # Check image column for "DELIVERY" text (sample3 pattern)
-    image_col = col_map.get('image')
+    image_col = cols.image if cols is not None else col_map.get('image')
     if image_col:
-        image_value = _get_cell_value(ws, row, image_col)
-        if image_value:
-            text = _normalize_text(image_value)
-            if text == 'delivery':
-                return True
+        if image_col <= len(norm):
+            text = norm[image_col - 1]
+        else:
+            text = _normalize_text(_row_value(values, image_col))
+        if text == 'delivery':
+            return True
     
     return False
 
 
-def _is_detail_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> tuple[bool, str | None, str | None]:
+def _is_detail_row(
+    values: tuple[Any, ...],
+    col_map: dict[str, int],
+    features: _RowFeatures | None = None,
+) -> tuple[bool, str | None, str | None]:
     """Check if a row is a detail row in grouped layout (sample3 style).
     
     Detail rows have:
@@ -249,40 +349,41 @@ def _is_detail_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> tuple[
     Instead, we check for detail keys in the description columns.
     
     Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
+        values: Row tuple from _materialize_rows()
         col_map: Column mapping from map_columns()
+        features: Precomputed _row_features(values), computed if omitted
         
     Returns:
         Tuple of (is_detail_row, key, value)
     """
+    if features is None:
+        features = _row_features(values)
+    norm = features.norm
+    
     # In sample3, the key is typically in column D (index 4) and value in column E (index 5)
     # Check columns 3-6 for key:value pattern
     
-    for col in range(3, min(7, (ws.max_column or 1) + 1)):
-        value = _get_cell_value(ws, row, col)
-        if value is None:
+    for col, text in enumerate(norm[2:6], 3):
+        if not text:
             continue
         
-        text = _normalize_text(value)
-        
         # Skip if this is "Item:" - that's an item row, not a detail row
-        if text == 'item:':
+        if text == _ITEM_KEY:
             return False, None, None
         
         # Check if this looks like a detail key (ends with ":" and is a known key)
         # Only match known detail keys to avoid false positives
-        if text in DETAIL_ROW_KEYS:
+        if text in _DETAIL_KEYS_FROZEN:
             # Get the value from the next column
-            next_col_value = _get_cell_value(ws, row, col + 1)
+            next_col_value = _row_value(values, col + 1)
             key = text.rstrip(':').strip()
             val = str(next_col_value).strip() if next_col_value else None
             return True, key, val
         
         # Also check for generic key:value pattern but be more strict
         # Must end with ":" and have a value in the next column
-        if text.endswith(':') and len(text) < 25 and len(text) > 2:
-            next_col_value = _get_cell_value(ws, row, col + 1)
+        if _GENERIC_KEY_RE.fullmatch(text):
+            next_col_value = _row_value(values, col + 1)
             if next_col_value is not None and str(next_col_value).strip():
                 key = text.rstrip(':').strip()
                 val = str(next_col_value).strip()
@@ -291,7 +392,12 @@ def _is_detail_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> tuple[
     return False, None, None
 
 
-def _is_item_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> bool:
+def _is_item_row(
+    values: tuple[Any, ...],
+    col_map: dict[str, int],
+    features: _RowFeatures | None = None,
+    cols: _ScanColumns | None = None,
+) -> bool:
     """Check if a row is an item row (start of a product in grouped layout).
     
     Item rows have:
@@ -300,30 +406,30 @@ def _is_item_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> bool:
     - Typically have qty and/or cost values
     
     Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
+        values: Row tuple from _materialize_rows()
         col_map: Column mapping from map_columns()
+        features: Precomputed _row_features(values), computed if omitted
+        cols: Precomputed _scan_columns(col_map), computed if omitted
         
     Returns:
         True if this is an item row
     """
-    doc_code_col = col_map.get('doc_code', 1)
+    if features is None:
+        features = _row_features(values)
+    norm = features.norm
+    
+    doc_code_col = cols.doc_code if cols is not None else col_map.get('doc_code', 1)
     
     # Check for doc_code in column A
-    doc_code_value = _get_cell_value(ws, row, doc_code_col)
+    doc_code_value = _row_value(values, doc_code_col)
     has_doc_code = doc_code_value is not None and str(doc_code_value).strip()
     
     # Check for "Item:" pattern in columns 3-6 (sample3 pattern)
     has_item_key = False
-    for col in range(3, min(7, (ws.max_column or 1) + 1)):
-        value = _get_cell_value(ws, row, col)
-        if value is None:
-            continue
-        
-        text = _normalize_text(value)
-        if text == 'item:':
+    for col, text in enumerate(norm[2:6], 3):
+        if text == _ITEM_KEY:
             # Check if there's a value in the next column
-            next_col_value = _get_cell_value(ws, row, col + 1)
+            next_col_value = _row_value(values, col + 1)
             if next_col_value is not None and str(next_col_value).strip():
                 has_item_key = True
                 break
@@ -333,7 +439,101 @@ def _is_item_row(ws: "Worksheet", row: int, col_map: dict[str, int]) -> bool:
     return has_doc_code or has_item_key
 
 
-def _detect_layout_type(ws: "Worksheet", header_row: int, col_map: dict[str, int], sample_rows: int = 50) -> str:
+class RowKind(Enum):
+    """Classification of a data row below the header."""
+    
+    EMPTY = 'empty'
+    SECTION = 'section'
+    SKIP = 'skip'
+    ITEM = 'item'
+    DETAIL = 'detail'
+    OTHER = 'other'
+
+
+def _classify_row(
+    values: tuple[Any, ...],
+    col_map: dict[str, int],
+    features: _RowFeatures | None = None,
+    cols: _ScanColumns | None = None,
+) -> tuple[RowKind, Any]:
+    """Classify a row in a single pass of the row checks.
+    
+    Checks are applied in the order the row iterators rely on: empty, section
+    header, skip row, "Item:" row, detail row.
+    
+    Args:
+        values: Row tuple from _materialize_rows()
+        col_map: Column mapping from map_columns()
+        features: Precomputed _row_features(values), computed if omitted
+        cols: Precomputed _scan_columns(col_map), computed if omitted
+        
+    Returns:
+        Tuple of (kind, payload) where payload is the section name for SECTION,
+        the item name for ITEM, a (key, value) tuple for DETAIL, else None
+    """
+    if _is_empty_row(values, col_map):
+        return RowKind.EMPTY, None
+    
+    if cols is None:
+        cols = _scan_columns(col_map)
+    if features is None:
+        features = _row_features(values)
+    
+    is_section, section_name = _is_section_header(values, col_map, cols=cols, features=features)
+    if is_section:
+        return RowKind.SECTION, section_name
+    
+    if _is_skip_row(values, col_map, features, cols):
+        return RowKind.SKIP, None
+    
+    has_item, item_value = _has_item_key(values, features)
+    if has_item:
+        return RowKind.ITEM, item_value
+    
+    is_detail, detail_key, detail_value = _is_detail_row(values, col_map, features)
+    if is_detail:
+        return RowKind.DETAIL, (detail_key, detail_value)
+    
+    return RowKind.OTHER, None
+
+
+def _layout_from_classified(classified: Iterable[tuple[RowKind, Any]]) -> str:
+    """Pick the layout type from already classified sample rows.
+    
+    Both counts only grow, so the scan stops as soon as the sample is
+    conclusively grouped.
+    
+    Args:
+        classified: (kind, payload) tuples from _classify_row()
+        
+    Returns:
+        'grouped' for sample3-style grouped rows, 'single' for single-row-per-product
+    """
+    detail_key_count = 0  # Count of known detail keys (Maker:, Name:, etc.)
+    item_key_count = 0  # Count of "Item:" keys found
+    
+    for kind, payload in classified:
+        if kind is RowKind.ITEM:
+            item_key_count += 1
+        elif kind is RowKind.DETAIL and f'{payload[0]}:' in _DETAIL_KEYS_FROZEN:
+            # Generic "key:" rows don't count towards layout detection
+            detail_key_count += 1
+        else:
+            continue
+        
+        # If we see "Item:" keys and detail keys, it's grouped layout
+        # The key indicator is the presence of "Item:" followed by detail rows
+        if item_key_count > 0 and detail_key_count > 0:
+            return 'grouped'
+        
+        # If we see many detail keys (even without Item:), it might be grouped
+        if detail_key_count >= 5:
+            return 'grouped'
+    
+    return 'single'
+
+
+def _detect_layout_type(rows: list[tuple[Any, ...]], col_map: dict[str, int], sample_rows: int = 50) -> str:
     """Detect the layout type of the worksheet.
     
     Grouped layout (sample3 style) is characterized by:
@@ -345,129 +545,63 @@ def _detect_layout_type(ws: "Worksheet", header_row: int, col_map: dict[str, int
     - Multi-line text in cells (specs, manufacturer columns)
     
     Args:
-        ws: Worksheet object
-        header_row: Header row number (1-indexed)
+        rows: Row tuples following the header row (from _materialize_rows())
         col_map: Column mapping from map_columns()
         sample_rows: Number of rows to sample for detection
         
     Returns:
         'grouped' for sample3-style grouped rows, 'single' for single-row-per-product
     """
-    # Sample rows after header to detect pattern
-    detail_key_count = 0  # Count of detail keys (Maker:, Name:, etc.)
-    item_key_count = 0  # Count of "Item:" keys found
-    
-    max_row = min(header_row + sample_rows, ws.max_row or header_row + 1)
-    
-    for row in range(header_row + 1, max_row + 1):
-        # Check columns 3-6 for key patterns (typical location for detail keys)
-        for col in range(3, min(7, (ws.max_column or 1) + 1)):
-            value = _get_cell_value(ws, row, col)
-            if value is None:
-                continue
-            
-            text = _normalize_text(value)
-            
-            # Check for "Item:" key (indicates grouped layout)
-            if text == 'item:':
-                item_key_count += 1
-                break
-            
-            # Check for detail keys (Maker:, Name:, Finish:, etc.)
-            if text in DETAIL_ROW_KEYS and text != 'item:':
-                detail_key_count += 1
-                break
-    
-    # If we see "Item:" keys and detail keys, it's grouped layout
-    # The key indicator is the presence of "Item:" followed by detail rows
-    if item_key_count > 0 and detail_key_count > 0:
-        return 'grouped'
-    
-    # If we see many detail keys (even without Item:), it might be grouped
-    if detail_key_count >= 5:
-        return 'grouped'
-    
-    return 'single'
+    cols = _scan_columns(col_map)
+    return _layout_from_classified(_classify_row(values, col_map, cols=cols) for values in rows[:sample_rows])
 
 
 def _extract_row_data(
-    ws: "Worksheet",
+    values: tuple[Any, ...],
     row: int,
     col_map: dict[str, int],
+    cols: _ScanColumns | None = None,
 ) -> dict[str, Any]:
     """Extract data from a single row based on column mapping.
     
     Args:
-        ws: Worksheet object
+        values: Row tuple from _materialize_rows()
         row: Row number (1-indexed)
         col_map: Column mapping from map_columns()
+        cols: Precomputed _scan_columns(col_map), computed if omitted
         
     Returns:
         Dictionary with canonical column names as keys and cell values
     """
     data: dict[str, Any] = {'row_num': row}
     
-    for canonical, col in col_map.items():
-        value = _get_cell_value(ws, row, col)
-        if value is not None:
+    mapped = cols.mapped if cols is not None else col_map.items()
+    for canonical, col in mapped:
+        value = _row_value(values, col)
+        # Exact type checks cover the common cell types without an isinstance chain
+        value_type = type(value)
+        if value_type is str:
+            value = value.strip()
+        elif value is None or value_type in _NUMERIC_TYPES:
+            # Keep numeric values as-is
+            pass
+        elif isinstance(value, str):
+            value = value.strip()
+        elif not isinstance(value, (int, float)):
             # Convert to string and strip whitespace
-            if isinstance(value, str):
-                value = value.strip()
-            elif isinstance(value, (int, float)):
-                # Keep numeric values as-is
-                pass
-            else:
-                value = str(value).strip()
+            value = str(value).strip()
         data[canonical] = value
     
     return data
 
 
-def _extract_grouped_item_data(
-    ws: "Worksheet",
-    row: int,
-    col_map: dict[str, int],
-) -> dict[str, Any]:
-    """Extract data from an item row in grouped layout (sample3 style).
-    
-    In grouped layout, the item row has:
-    - doc_code in column A
-    - Area/location in column B
-    - "Item:" in description column with product name in next column
-    - qty, cost, rrp in their respective columns
-    
-    Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
-        col_map: Column mapping from map_columns()
-        
-    Returns:
-        Dictionary with extracted data
-    """
-    data = _extract_row_data(ws, row, col_map)
-    
-    # For grouped layout, also extract the "Item:" value
-    # Look for "Item:" pattern and extract the product name
-    for col in range(1, min(10, (ws.max_column or 1) + 1)):
-        value = _get_cell_value(ws, row, col)
-        if value is None:
-            continue
-        
-        text = _normalize_text(value)
-        if text == 'item:':
-            next_col_value = _get_cell_value(ws, row, col + 1)
-            if next_col_value:
-                data['item_name'] = str(next_col_value).strip()
-            break
-    
-    return data
-
-
 def iter_product_rows(
     ws: "Worksheet",
     header_row: int,
     col_map: dict[str, int],
     max_rows: int | None = None,
+    rows: list[tuple[Any, ...]] | None = None,
+    detail_mode: Literal['list', 'flatten'] = 'list',
 ) -> Iterator[dict[str, Any]]:
     """Iterate over product rows in a worksheet.
     
@@ -488,6 +622,19 @@ def iter_product_rows(
         header_row: Header row number (1-indexed)
         col_map: Column mapping from map_columns()
         max_rows: Maximum rows to process (None for all)
+        rows: Optional pre-materialized sheet values, one tuple per row starting
+            at row 1 (e.g. ``list(ws.iter_rows(values_only=True))``). When given,
+            the worksheet is not accessed at all. This lets callers that open
+            the workbook with ``load_workbook(..., read_only=True, data_only=True)``
+            stream the sheet once; note that merged regions cannot be filled in
+            read-only mode, so grouped layouts relying on merged doc codes should
+            still use a normal-mode worksheet.
+        detail_mode: 'list' (default) collects grouped-layout detail rows into
+            'detail_rows'. 'flatten' collects them into a single 'details'
+            mapping of key -> value instead (first occurrence of a key wins),
+            kept apart from the mapped columns so no value is shadowed, and
+            leaves 'detail_rows' empty, avoiding a dict allocation per detail
+            row.
         
     Yields:
         Dictionary with product data including:
@@ -495,6 +642,7 @@ def iter_product_rows(
         - 'row_num': Source row number
         - 'section': Current section context (if any)
         - 'detail_rows': List of detail row dicts (for grouped layout)
+        - 'details': Detail key -> value mapping (only when detail_mode='flatten')
         
     Example:
         >>> from openpyxl import load_workbook
@@ -509,172 +657,213 @@ def iter_product_rows(
         >>> for product in iter_product_rows(ws, header_row=4, col_map=col_map):
         ...     print(product['doc_code'], product.get('section'))
     """
-    # Detect layout type
-    layout_type = _detect_layout_type(ws, header_row, col_map)
+    rows, classified, cols, grouped = _classify_sheet(ws, header_row, col_map, max_rows, rows)
+    yield from _iter_rows(
+        rows,
+        classified,
+        header_row + 1,
+        col_map,
+        cols,
+        grouped=grouped,
+        flatten_details=detail_mode == 'flatten',
+    )
+
+
+def _classify_sheet(
+    ws: "Worksheet",
+    header_row: int,
+    col_map: dict[str, int],
+    max_rows: int | None = None,
+    rows: list[tuple[Any, ...]] | None = None,
+) -> tuple[
+    list[tuple[Any, ...]],
+    list[tuple[RowKind, Any]],
+    _ScanColumns,
+    bool,
+]:
+    """Materialize, normalize and classify the data rows below the header.
+    
+    Args:
+        ws: Worksheet object (unused when rows is given)
+        header_row: Header row number (1-indexed)
+        col_map: Column mapping from map_columns()
+        max_rows: Maximum rows to process (None for all)
+        rows: Optional pre-materialized sheet values starting at row 1
+        
+    Returns:
+        Tuple of (rows, classified, cols, grouped) where both lists start at
+        header_row + 1 and grouped is True for grouped layout
+    """
+    sample_rows = 50
     
-    # Determine row range
     start_row = header_row + 1
-    end_row = ws.max_row or start_row
+    if rows is None:
+        # ws.max_row / ws.max_column recompute the sheet dimensions on every
+        # access, so read them once per call.
+        max_row = ws.max_row or start_row
+        # Nothing reads past the empty-row prefix or the last mapped column,
+        # so don't materialize wider rows than that
+        max_col = min(ws.max_column or 1, max(_EMPTY_ROW_MAX_COLS, max(col_map.values(), default=0)))
+    else:
+        max_row = len(rows) or start_row
+    
+    # Determine row range
+    end_row = max_row
     if max_rows:
         end_row = min(end_row, start_row + max_rows - 1)
     
-    # Track current section for section header propagation
-    current_section: str | None = None
-    
-    if layout_type == 'grouped':
-        # Grouped layout: collect item + detail rows
-        yield from _iter_grouped_rows(ws, start_row, end_row, col_map, current_section)
+    # Read every row we need (data rows plus the layout sample) in one pass
+    last_row = max(end_row, min(header_row + sample_rows, max_row))
+    if rows is None:
+        rows = _materialize_rows(ws, start_row, last_row, max_col)
     else:
-        # Single-row layout: yield each product row
-        yield from _iter_single_rows(ws, start_row, end_row, col_map, current_section)
-
-
-def _iter_single_rows(
-    ws: "Worksheet",
-    start_row: int,
-    end_row: int,
-    col_map: dict[str, int],
-    current_section: str | None,
-) -> Iterator[dict[str, Any]]:
-    """Iterate over single-row-per-product layout.
+        rows = rows[start_row - 1:last_row]
     
-    Args:
-        ws: Worksheet object
-        start_row: First data row (after header)
-        end_row: Last row to process
-        col_map: Column mapping
-        current_section: Initial section context
-        
-    Yields:
-        Product data dictionaries
-    """
-    for row in range(start_row, end_row + 1):
-        # Skip empty rows
-        if _is_empty_row(ws, row, col_map):
-            continue
-        
-        # Check for section header
-        is_section, section_name = _is_section_header(ws, row, col_map)
-        if is_section:
-            current_section = section_name
-            continue
-        
-        # Skip delivery/total rows
-        if _is_skip_row(ws, row, col_map):
-            continue
-        
-        # Check if this is a product row (has doc_code or meaningful data)
-        doc_code_col = col_map.get('doc_code', 1)
-        doc_code_value = _get_cell_value(ws, row, doc_code_col)
-        
-        # For single-row layout, we need at least a doc_code or item_location
-        item_location_col = col_map.get('item_location')
-        item_location_value = item_location_col and _get_cell_value(ws, row, item_location_col)
-        
-        if not doc_code_value and not item_location_value:
-            continue
-        
-        # Extract row data
-        data = _extract_row_data(ws, row, col_map)
-        data['section'] = current_section
-        data['detail_rows'] = []
-        
-        yield data
+    # Column lookups are invariant for the whole scan
+    cols = _scan_columns(col_map)
+    
+    # Classify each row once; layout detection reuses the leading sample
+    classified = [_classify_row(values, col_map, cols=cols) for values in rows]
+    
+    # Detect layout type
+    layout_type = _layout_from_classified(classified[:sample_rows])
+    count = end_row - start_row + 1
+    
+    return rows[:count], classified[:count], cols, layout_type == 'grouped'
 
 
-def _has_item_key(ws: "Worksheet", row: int) -> tuple[bool, str | None]:
+def _has_item_key(values: tuple[Any, ...], features: _RowFeatures | None = None) -> tuple[bool, str | None]:
     """Check if a row has an "Item:" key in columns 3-6.
     
     Args:
-        ws: Worksheet object
-        row: Row number (1-indexed)
+        values: Row tuple from _materialize_rows()
+        features: Precomputed _row_features(values), computed if omitted
         
     Returns:
         Tuple of (has_item_key, item_value)
     """
-    for col in range(3, min(7, (ws.max_column or 1) + 1)):
-        value = _get_cell_value(ws, row, col)
-        if value is None:
-            continue
-        
-        text = _normalize_text(value)
-        if text == 'item:':
+    if features is None:
+        features = _row_features(values)
+    norm = features.norm
+    
+    for col, text in enumerate(norm[2:6], 3):
+        if text == _ITEM_KEY:
             # Get the value from the next column
-            next_col_value = _get_cell_value(ws, row, col + 1)
+            next_col_value = _row_value(values, col + 1)
             item_value = str(next_col_value).strip() if next_col_value else None
             return True, item_value
     
     return False, None
 
 
-def _iter_grouped_rows(
-    ws: "Worksheet",
+def _is_single_product_row(values: tuple[Any, ...], cols: _ScanColumns) -> bool:
+    """Check if a classified row is a product in single-row layout.
+    
+    Args:
+        values: Row tuple from _materialize_rows()
+        cols: _scan_columns(col_map)
+        
+    Returns:
+        True if the row has a doc_code or an item_location value
+    """
+    # Check if this is a product row (has doc_code or meaningful data)
+    doc_code_value = _row_value(values, cols.doc_code)
+    
+    # For single-row layout, we need at least a doc_code or item_location
+    item_location_value = cols.item_location and _row_value(values, cols.item_location)
+    
+    return bool(doc_code_value or item_location_value)
+
+
+def _iter_rows(
+    rows: list[tuple[Any, ...]],
+    classified: list[tuple[RowKind, Any]],
     start_row: int,
-    end_row: int,
     col_map: dict[str, int],
-    current_section: str | None,
+    cols: _ScanColumns,
+    grouped: bool,
+    flatten_details: bool = False,
 ) -> Iterator[dict[str, Any]]:
-    """Iterate over grouped-row layout (sample3 style).
+    """Build products from classified rows for either layout.
+    
+    Single-row layout (sample1/2): each non-section, non-skip row with a
+    doc_code or item_location is yielded as a product.
     
-    In this layout:
+    Grouped layout (sample3):
     - Item rows have "Item:" in column D with product name in column E
     - Detail rows have keys like "Maker:", "Name:", "Finish:" in column D
-    - Product is yielded when next item row or end is reached
+    - Product is yielded when next item row, section header or end is reached
     
     Note: After fill_merged_regions, doc_code values are propagated to all rows
     in a merged range, so we can't rely on empty doc_code to detect detail rows.
     Instead, we check for "Item:" key to identify item rows.
     
     Args:
-        ws: Worksheet object
+        rows: Row tuples from _materialize_rows(), starting at start_row
+        classified: _classify_row() result for each entry in rows
         start_row: First data row (after header)
-        end_row: Last row to process
         col_map: Column mapping
-        current_section: Initial section context
+        cols: _scan_columns(col_map)
+        grouped: True for grouped layout, False for single-row layout
+        flatten_details: Store detail values in product['details'] instead of
+            appending to 'detail_rows'
         
     Yields:
-        Product data dictionaries with detail_rows attached
+        Product data dictionaries (with detail_rows attached for grouped layout)
     """
+    # Track current section for section header propagation
+    current_section: str | None = None
     current_product: dict[str, Any] | None = None
     
-    for row in range(start_row, end_row + 1):
-        # Skip empty rows
-        if _is_empty_row(ws, row, col_map):
+    for row, (values, (kind, payload)) in enumerate(zip(rows, classified), start_row):
+        # Skip empty and delivery/total rows
+        if kind is RowKind.EMPTY or kind is RowKind.SKIP:
             continue
         
-        # Check for section header
-        is_section, section_name = _is_section_header(ws, row, col_map)
-        if is_section:
+        if kind is RowKind.SECTION:
             # Yield current product before section change
             if current_product:
                 yield current_product
                 current_product = None
-            current_section = section_name
+            current_section = payload
             continue
         
-        # Skip delivery/total rows
-        if _is_skip_row(ws, row, col_map):
+        if not grouped:
+            if not _is_single_product_row(values, cols):
+                continue
+            
+            # Extract row data
+            data = _extract_row_data(values, row, col_map, cols)
+            data['section'] = current_section
+            data['detail_rows'] = []
+            if flatten_details:
+                data['details'] = {}
+            
+            yield data
             continue
         
-        # Check if this row has an "Item:" key (start of new product)
-        has_item, item_value = _has_item_key(ws, row)
-        if has_item:
+        if kind is RowKind.ITEM:
             # Yield previous product
             if current_product:
                 yield current_product
             
             # Start new product
-            current_product = _extract_grouped_item_data(ws, row, col_map)
+            # Item rows carry the product columns; the name comes from the "Item:" cell
+            current_product = _extract_row_data(values, row, col_map, cols)
             current_product['section'] = current_section
             current_product['detail_rows'] = []
-            current_product['item_name'] = item_value
+            if flatten_details:
+                current_product['details'] = {}
+            current_product['item_name'] = payload
             continue
         
-        # Check if this is a detail row (has detail key like Maker:, Name:, etc.)
-        is_detail, detail_key, detail_value = _is_detail_row(ws, row, col_map)
-        if is_detail:
+        if kind is RowKind.DETAIL:
             if current_product:
                 # Add detail to current product
+                detail_key, detail_value = payload
+                if flatten_details:
+                    current_product['details'].setdefault(detail_key, detail_value)
+                    continue
                 current_product['detail_rows'].append({
                     'row_num': row,
                     'key': detail_key,
@@ -708,10 +897,20 @@ def get_product_count(
     Returns:
         Estimated number of products
     """
-    count = 0
-    for _ in iter_product_rows(ws, header_row, col_map):
-        count += 1
-    return count
+    # Count straight from the row classification, without building product dicts
+    rows, classified, cols, grouped = _classify_sheet(ws, header_row, col_map)
+    if grouped:
+        # Every "Item:" row starts a product
+        return sum(1 for kind, _ in classified if kind is RowKind.ITEM)
+    
+    return sum(
+        1
+        for values, (kind, _) in zip(rows, classified)
+        if kind is not RowKind.EMPTY
+        and kind is not RowKind.SECTION
+        and kind is not RowKind.SKIP
+        and _is_single_product_row(values, cols)
+    )
 
 
 def extract_all_products(
@@ -8,7 +8,7 @@ Key functions:
 - is_schedule_sheet: Determine if a worksheet contains schedule data
 """
 
-import re
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -128,15 +128,19 @@ MIN_HEADER_MATCHES = 2
 # We allow a sheet to qualify if it has either a doc_code column OR a product_name
 # column, provided there is sufficient additional schedule-like structure.
 # Additional columns that strengthen schedule detection.
-SUPPORTING_COLUMNS = {'item_location', 'specs', 'manufacturer', 'cost', 'qty', 'notes', 'image'}
+SUPPORTING_COLUMNS = frozenset({'item_location', 'specs', 'manufacturer', 'cost', 'qty', 'notes', 'image'})
 
 # Prefer header rows that include at least one of these columns.
-PREFERRED_HEADER_COLUMNS = {'doc_code', 'product_name'}
+PREFERRED_HEADER_COLUMNS = frozenset({'doc_code', 'product_name'})
 
 # For product_name-only schedules, require at least this many supporting columns
 # (excluding the product_name column itself).
 MIN_SUPPORTING_FOR_PRODUCT_NAME_ONLY = 2
 
+# A header row with doc_code and at least this many supporting columns ends the
+# header scan early.
+CONFIDENT_HEADER_SUPPORTING = 3
+
 
 def _normalize_header(text: str | None) -> str:
     """Normalize header text for comparison.
@@ -163,11 +167,9 @@ def _normalize_header(text: str | None) -> str:
     # Take first line only (some headers have multi-line content)
     text = text.split('\n')[0]
     
-    # Convert to lowercase and strip
-    text = text.lower().strip()
-    
-    # Replace multiple spaces with single space
-    text = re.sub(r'\s+', ' ', text)
+    # Convert to lowercase, strip, and replace whitespace runs with a single
+    # space (str.split() collapses the same characters as the regex \s+)
+    text = ' '.join(text.lower().split())
     
     # Remove trailing special characters that might be formatting
     text = text.rstrip(':.-')
@@ -175,6 +177,13 @@ def _normalize_header(text: str | None) -> str:
     return text
 
 
+# One bit per canonical column, so row scoring can test column groups with
+# integer masks instead of building set intersections.
+_COLUMN_BITS: dict[str, int] = {name: 1 << index for index, name in enumerate(HEADER_SYNONYMS)}
+_DOC_CODE_BIT = _COLUMN_BITS['doc_code']
+_PREFERRED_MASK = sum(_COLUMN_BITS[name] for name in PREFERRED_HEADER_COLUMNS)
+_SUPPORTING_MASK = sum(_COLUMN_BITS[name] for name in SUPPORTING_COLUMNS)
+
 # Build a reverse lookup: normalized header text -> canonical name
 _HEADER_LOOKUP: dict[str, str] = {}
 for canonical, synonyms in HEADER_SYNONYMS.items():
@@ -183,6 +192,13 @@ for canonical, synonyms in HEADER_SYNONYMS.items():
         if normalized_synonym:
             _HEADER_LOOKUP[normalized_synonym] = canonical
 
+# Synonyms tried by the partial-match scan, longest first so that the most
+# specific synonym wins, e.g. 'specifications' over 'ref' in
+# "refer to specifications". Equal lengths keep their lookup order.
+_PARTIAL_SYNONYMS: tuple[tuple[str, str], ...] = tuple(
+    sorted(_HEADER_LOOKUP.items(), key=lambda item: -len(item[0]))
+)
+
 
 def _match_header(text: str) -> str | None:
     """Match normalized header text to a canonical column name.
@@ -201,84 +217,117 @@ def _match_header(text: str) -> str | None:
         return _HEADER_LOOKUP[text]
     
     # Try partial matching for compound headers
-    # e.g., "item & location (see notes)" should match "item & location"
-    for synonym, canonical in _HEADER_LOOKUP.items():
-        if text.startswith(synonym) or synonym in text:
+    # e.g., "item & location (see notes)" should match "item & location".
+    # The longest contained synonym wins.
+    for synonym, canonical in _PARTIAL_SYNONYMS:
+        if synonym in text:
             return canonical
     
     return None
 
 
-def _score_row_as_header(ws: "Worksheet", row: int, max_cols: int = 20) -> tuple[int, set[str]]:
-    """Score a row based on how many header synonyms it matches.
+@functools.lru_cache(maxsize=4096)
+def _canonical_for_text(text: str) -> str | None:
+    """Normalize and match a header cell's text in one memoized call.
+    
+    The same header strings recur across rows, sheets and workbooks, so
+    normalization and the partial-match scan run once per distinct text.
     
     Args:
-        ws: Worksheet to examine
-        row: Row number (1-indexed)
-        max_cols: Maximum number of columns to check
+        text: Raw cell text
         
     Returns:
-        Tuple of (score, set of matched canonical column names)
+        Canonical column name if matched, None otherwise
     """
-    matched_columns: set[str] = set()
+    return _match_header(_normalize_header(text))
+
+
+def _match_row_columns(values: tuple, max_cols: int = 20) -> dict[str, int]:
+    """Map canonical column names to column indices for one row of values.
     
-    for col in range(1, max_cols + 1):
-        cell = ws.cell(row=row, column=col)
-        value = cell.value
+    Args:
+        values: Row values as read by ws.iter_rows(values_only=True)
+        max_cols: Maximum number of columns to check
         
+    Returns:
+        Dict mapping canonical column names to column indices (1-indexed),
+        keeping only the first occurrence of each canonical name
+    """
+    columns: dict[str, int] = {}
+    
+    for col, value in enumerate(values[:max_cols], start=1):
         if value is None:
             continue
         
-        normalized = _normalize_header(value)
-        if not normalized:
-            continue
-        
-        canonical = _match_header(normalized)
-        if canonical:
-            matched_columns.add(canonical)
+        canonical = _canonical_for_text(value if isinstance(value, str) else str(value))
+        if canonical and canonical not in columns:
+            # Only store first occurrence of each canonical name
+            columns[canonical] = col
     
+    return columns
+
+
+def _read_row(ws: "Worksheet", row: int, max_cols: int) -> tuple:
+    """Read a single worksheet row as a tuple of values."""
+    for values in ws.iter_rows(min_row=row, max_row=row, max_col=max_cols, values_only=True):
+        return values
+    return ()
+
+
+def _score_row_as_header(ws: "Worksheet", row: int, max_cols: int = 20) -> tuple[int, set[str]]:
+    """Score a row based on how many header synonyms it matches.
+    
+    Args:
+        ws: Worksheet to examine
+        row: Row number (1-indexed)
+        max_cols: Maximum number of columns to check
+        
+    Returns:
+        Tuple of (score, set of matched canonical column names)
+    """
+    matched_columns = set(_match_row_columns(_read_row(ws, row, max_cols), max_cols))
     return len(matched_columns), matched_columns
 
 
-def find_header_row(ws: "Worksheet", max_scan: int = 50) -> int | None:
-    """Find the header row in a worksheet.
+def _locate_header(ws: "Worksheet", max_scan: int = 50, max_cols: int = 20) -> tuple[int, dict[str, int]] | None:
+    """Find the header row and its column mapping in a single pass.
     
-    Scans the first `max_scan` rows and scores each row based on how many
-    cells match known header synonyms. Returns the row with the highest
-    score if it meets the minimum threshold.
+    The first `max_scan` rows are read with one ws.iter_rows() call and
+    scored in Python, so the column mapping of the winning row comes for
+    free instead of being re-read from the worksheet.
     
     Args:
-        ws: openpyxl Worksheet object to examine
-        max_scan: Maximum number of rows to scan (default 50)
+        ws: Worksheet to examine
+        max_scan: Maximum number of rows to scan
+        max_cols: Maximum number of columns to check
         
     Returns:
-        Row number (1-indexed) of the header row, or None if not found
-        
-    Example:
-        >>> from openpyxl import load_workbook
-        >>> wb = load_workbook("schedule.xlsx")
-        >>> ws = wb.active
-        >>> header_row = find_header_row(ws)
-        >>> if header_row:
-        ...     print(f"Header found at row {header_row}")
+        Tuple of (header row, column mapping), or None if no header was found
     """
     best_row: int | None = None
     best_score = 0
-    best_columns: set[str] = set()
+    best_columns: dict[str, int] = {}
+    best_mask = 0
     
     # Determine actual row range to scan
     actual_max = min(max_scan, ws.max_row or 1)
     
-    for row in range(1, actual_max + 1):
-        score, matched_columns = _score_row_as_header(ws, row)
+    rows = ws.iter_rows(min_row=1, max_row=actual_max, max_col=max_cols, values_only=True)
+    for row, values in enumerate(rows, start=1):
+        columns = _match_row_columns(values, max_cols)
+        score = len(columns)
         
         # Must have at least minimum matches
         if score < MIN_HEADER_MATCHES:
             continue
         
+        mask = 0
+        for name in columns:
+            mask |= _COLUMN_BITS[name]
+        
         # Prefer rows that include a primary schedule identifier column.
-        has_required = bool(matched_columns & PREFERRED_HEADER_COLUMNS)
-        has_supporting = bool(matched_columns & SUPPORTING_COLUMNS)
+        has_required = bool(mask & _PREFERRED_MASK)
+        has_supporting = bool(mask & _SUPPORTING_MASK)
         
         # Calculate weighted score
         # Required columns are worth more
@@ -292,23 +341,60 @@ def find_header_row(ws: "Worksheet", max_scan: int = 50) -> int | None:
         if weighted_score > best_score:
             best_score = weighted_score
             best_row = row
-            best_columns = matched_columns
-        elif weighted_score == best_score and has_required and 'doc_code' not in best_columns:
+            best_columns = columns
+            best_mask = mask
+        elif weighted_score == best_score and has_required and not best_mask & _DOC_CODE_BIT:
             # Prefer row with doc_code if scores are equal
             best_row = row
-            best_columns = matched_columns
+            best_columns = columns
+            best_mask = mask
+        
+        # A doc_code column plus several supporting columns is a near-certain
+        # header, so stop instead of scanning the remaining rows.
+        if (
+            best_row == row
+            and mask & _DOC_CODE_BIT
+            and (mask & _SUPPORTING_MASK).bit_count() >= CONFIDENT_HEADER_SUPPORTING
+        ):
+            break
     
     # Final validation: must have at least required columns or strong supporting evidence
     if best_row is not None:
-        has_required = bool(best_columns & PREFERRED_HEADER_COLUMNS)
-        has_multiple_supporting = len(best_columns & SUPPORTING_COLUMNS) >= 2
+        has_required = bool(best_mask & _PREFERRED_MASK)
+        has_multiple_supporting = (best_mask & _SUPPORTING_MASK).bit_count() >= 2
         
         if has_required or has_multiple_supporting:
-            return best_row
+            return best_row, best_columns
     
     return None
 
 
+def find_header_row(ws: "Worksheet", max_scan: int = 50) -> int | None:
+    """Find the header row in a worksheet.
+    
+    Scans the first `max_scan` rows and scores each row based on how many
+    cells match known header synonyms. Returns the row with the highest
+    score if it meets the minimum threshold.
+    
+    Args:
+        ws: openpyxl Worksheet object to examine
+        max_scan: Maximum number of rows to scan (default 50)
+        
+    Returns:
+        Row number (1-indexed) of the header row, or None if not found
+        
+    Example:
+        >>> from openpyxl import load_workbook
+        >>> wb = load_workbook("schedule.xlsx")
+        >>> ws = wb.active
+        >>> header_row = find_header_row(ws)
+        >>> if header_row:
+        ...     print(f"Header found at row {header_row}")
+    """
+    located = _locate_header(ws, max_scan)
+    return located[0] if located is not None else None
+
+
 def get_header_columns(ws: "Worksheet", header_row: int, max_cols: int = 20) -> dict[str, int]:
     """Get mapping of canonical column names to column indices for a header row.
     
@@ -325,25 +411,26 @@ def get_header_columns(ws: "Worksheet", header_row: int, max_cols: int = 20) ->
         >>> print(columns)
         {'doc_code': 1, 'image': 2, 'item_location': 3, ...}
     """
-    columns: dict[str, int] = {}
+    return _match_row_columns(_read_row(ws, header_row, max_cols), max_cols)
+
+
+def _has_schedule_columns(column_names: set[str]) -> bool:
+    """Check whether header columns describe a schedule sheet.
     
-    for col in range(1, max_cols + 1):
-        cell = ws.cell(row=header_row, column=col)
-        value = cell.value
-        
-        if value is None:
-            continue
-        
-        normalized = _normalize_header(value)
-        if not normalized:
-            continue
+    Args:
+        column_names: Canonical column names found in the header row
         
-        canonical = _match_header(normalized)
-        if canonical and canonical not in columns:
-            # Only store first occurrence of each canonical name
-            columns[canonical] = col
+    Returns:
+        True if the columns are sufficient for a schedule sheet
+    """
+    if 'doc_code' in column_names:
+        return bool(column_names & SUPPORTING_COLUMNS)
     
-    return columns
+    if 'product_name' in column_names:
+        supporting = column_names & SUPPORTING_COLUMNS
+        return len(supporting) >= MIN_SUPPORTING_FOR_PRODUCT_NAME_ONLY
+    
+    return False
 
 
 def is_schedule_sheet(ws: "Worksheet", max_scan: int = 50) -> bool:
@@ -374,25 +461,14 @@ def is_schedule_sheet(ws: "Worksheet", max_scan: int = 50) -> bool:
         ...     if is_schedule_sheet(ws):
         ...         print(f"{sheet_name} is a schedule sheet")
     """
-    # Try to find header row
-    header_row = find_header_row(ws, max_scan)
+    # Try to find header row (and the columns it contains)
+    located = _locate_header(ws, max_scan)
     
-    if header_row is None:
+    if located is None:
         return False
     
-    # Get the columns found in the header
-    columns = get_header_columns(ws, header_row)
-    
-    column_names = set(columns.keys())
-
-    if 'doc_code' in column_names:
-        return bool(column_names & SUPPORTING_COLUMNS)
-
-    if 'product_name' in column_names:
-        supporting = column_names & SUPPORTING_COLUMNS
-        return len(supporting) >= MIN_SUPPORTING_FOR_PRODUCT_NAME_ONLY
-
-    return False
+    _, columns = located
+    return _has_schedule_columns(set(columns))
 
 
 def get_schedule_sheets(wb) -> list[tuple[str, "Worksheet", int]]:
@@ -414,19 +490,13 @@ def get_schedule_sheets(wb) -> list[tuple[str, "Worksheet", int]]:
     
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
-        header_row = find_header_row(ws)
+        located = _locate_header(ws)
         
-        if header_row is not None:
-            columns = get_header_columns(ws, header_row)
+        if located is not None:
+            header_row, columns = located
             
             # Validate it's a schedule sheet.
-            column_names = set(columns.keys())
-            if 'doc_code' in column_names and bool(column_names & SUPPORTING_COLUMNS):
+            if _has_schedule_columns(set(columns)):
                 schedule_sheets.append((sheet_name, ws, header_row))
-                continue
-            if 'product_name' in column_names:
-                supporting = column_names & SUPPORTING_COLUMNS
-                if len(supporting) >= MIN_SUPPORTING_FOR_PRODUCT_NAME_ONLY:
-                    schedule_sheets.append((sheet_name, ws, header_row))
     
     return schedule_sheets
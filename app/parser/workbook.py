@@ -4,19 +4,19 @@ This module provides safe loading of Excel workbooks with proper
 error handling for invalid, corrupt, or unsupported files.
 """
 
+import functools
 import io
+import operator
 import zipfile
-from typing import TYPE_CHECKING, Any
-
-import openpyxl
-from openpyxl import Workbook
-from openpyxl.utils.exceptions import InvalidFileException
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 if TYPE_CHECKING:
+    from openpyxl import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
+
     from app.core.models import Product, ParseResponse
 
 import re
-from openpyxl.cell.cell import Cell
 
 
 class WorkbookLoadError(Exception):
@@ -52,14 +52,26 @@ class WorkbookLoadError(Exception):
         return self.message
 
 
-def load_workbook_safe(file_bytes: bytes) -> Workbook:
-    """Safely load an Excel workbook from raw bytes.
+# ZIP end-of-central-directory signature and how far from the end it can be
+# (22-byte fixed record plus a comment of up to 65535 bytes)
+_ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+_ZIP_EOCD_SEARCH_WINDOW = 22 + 65535
+
+
+def load_workbook_safe(source: bytes | BinaryIO, read_only: bool = False) -> "Workbook":
+    """Safely load an Excel workbook from raw bytes or a binary file object.
 
-    This function validates and loads an Excel (.xlsx) file from bytes,
-    handling various error conditions gracefully.
+    This function validates and loads an Excel (.xlsx) file from bytes or a
+    file object, handling various error conditions gracefully.
 
     Args:
-        file_bytes: Raw bytes of the Excel file
+        source: Raw bytes of the Excel file, or a seekable binary file
+            object (e.g. an upload's spooled temporary file). File objects are
+            read from the start in place, without copying them into bytes.
+        read_only: Load in openpyxl's streaming read-only mode. Much faster and
+            lighter for callers that only read cell values sequentially (e.g.
+            get_schedule_name), but merged-cell information is unavailable, so
+            parse_workbook needs the default full load.
 
     Returns:
         Workbook: Loaded openpyxl Workbook object
@@ -78,9 +90,19 @@ def load_workbook_safe(file_bytes: bytes) -> Workbook:
         >>> wb = load_workbook_safe(file_bytes)
         >>> print(wb.sheetnames)
         ['Sheet1', 'Sheet2']
+        >>> with open("schedule.xlsx", "rb") as f:
+        ...     wb = load_workbook_safe(f)
     """
+    if isinstance(source, (bytes, bytearray)):
+        size = len(source)
+        # Create a file-like object from bytes
+        file_stream: BinaryIO = io.BytesIO(source)
+    else:
+        file_stream = source
+        size = file_stream.seek(0, io.SEEK_END)
+
     # Validate input is not empty
-    if not file_bytes:
+    if not size:
         raise WorkbookLoadError(
             message="Empty file",
             detail="The uploaded file contains no data"
@@ -88,14 +110,28 @@ def load_workbook_safe(file_bytes: bytes) -> Workbook:
 
     # Check minimum file size (ZIP files need at least a few bytes for header)
     # A valid xlsx file should be at least ~100 bytes (empty workbook)
-    if len(file_bytes) < 100:
+    if size < 100:
         raise WorkbookLoadError(
             message="Invalid file",
-            detail=f"File too small ({len(file_bytes)} bytes) to be a valid Excel workbook"
+            detail=f"File too small ({size} bytes) to be a valid Excel workbook"
         )
 
-    # Create a file-like object from bytes
-    file_stream = io.BytesIO(file_bytes)
+    # xlsx files are ZIP archives, which end with an end-of-central-directory
+    # record within the last 64 KiB (+22 bytes). Reject anything without one
+    # before openpyxl starts building a ZipFile.
+    file_stream.seek(max(0, size - _ZIP_EOCD_SEARCH_WINDOW))
+    has_eocd = _ZIP_EOCD_SIGNATURE in file_stream.read()
+    file_stream.seek(0)
+    if not has_eocd:
+        raise WorkbookLoadError(
+            message="Invalid file format",
+            detail="File is not a valid Excel workbook (corrupt or not .xlsx format)"
+        )
+
+    # openpyxl is imported on first use: its import is heavy and only this
+    # loader needs it at runtime
+    import openpyxl
+    from openpyxl.utils.exceptions import InvalidFileException
 
     try:
         # Load workbook with openpyxl
@@ -104,7 +140,7 @@ def load_workbook_safe(file_bytes: bytes) -> Workbook:
         workbook = openpyxl.load_workbook(
             file_stream,
             data_only=False,
-            read_only=False,
+            read_only=read_only,
         )
         return workbook
 
@@ -178,32 +214,47 @@ FORMULA_PATTERN = re.compile(
     re.IGNORECASE
 )
 
-# Pattern to detect Cover Sheet formula specifically
-COVER_SHEET_FORMULA_PATTERN = re.compile(
-    r"^=\s*'?\[?\d*\]?Cover\s*Sheet'?!\$?([A-Z]+)\$?(\d+)$",
-    re.IGNORECASE
-)
+# Sheet names in formula references that mean the Cover Sheet (e.g. "CoverSheet")
+COVER_SHEET_NAME_PATTERN = re.compile(r"Cover\s*Sheet", re.IGNORECASE)
 
 _TRAILING_QUALIFIER_PATTERN = re.compile(r"\s*\((?:ff&e|ffe)\s*tracker\)\s*$", re.IGNORECASE)
 
+# Lowercase substrings that mark a cell as a schedule title
+_TITLE_INDICATOR_RE = re.compile(r"schedule|project|interior|finish|ff&e|ffe")
+
+# Lowercase substrings of disclaimers/instructions found above headers
+_DISCLAIMER_RE = re.compile(
+    r"refer to drawings|refer to plans|for full detail|images and costs"
+    r"|verify on site|prior to order|indicative only|all dimensions"
+)
+
+_HAS_DIGIT_RE = re.compile(r"\d")
+_WORD_RE = re.compile(r"[A-Za-z&]+")
+
+# A sheet's mapped columns must include at least one of these to be parsed
+_SCHEDULE_SUPPORTING_COLUMNS = frozenset({
+    "item_location", "specs", "manufacturer", "notes", "qty", "cost", "product_name"
+})
+
 
 def _clean_schedule_name(text: str) -> str:
     """Normalize schedule name strings extracted from workbook cells."""
     cleaned = str(text).strip()
-    cleaned = _TRAILING_QUALIFIER_PATTERN.sub("", cleaned).strip()
+    # The qualifier always ends in ")", so most names skip the regex entirely.
+    if cleaned.endswith(")"):
+        cleaned = _TRAILING_QUALIFIER_PATTERN.sub("", cleaned).strip()
     return cleaned
 
 
-def _get_cell_string_value(cell: Cell) -> str | None:
-    """Extract string value from a cell, handling various types.
+def _cell_text(value: Any) -> str | None:
+    """Convert a raw cell value to stripped text, handling various types.
     
     Args:
-        cell: openpyxl Cell object
+        value: Cell value as read by ws.iter_rows(values_only=True)
         
     Returns:
-        String value or None if cell is empty or non-string
+        String value or None if cell is empty
     """
-    value = cell.value
     if value is None:
         return None
     if isinstance(value, str):
@@ -212,6 +263,30 @@ def _get_cell_string_value(cell: Cell) -> str | None:
     return str(value).strip()
 
 
+def _read_top_rows(ws: "Worksheet", max_row: int = 10, max_col: int = 2) -> list[tuple[Any, ...]]:
+    """Read the top-left block of a sheet as value tuples in one pass.
+    
+    Rows are padded to exactly `max_row` tuples of `max_col` values, so callers
+    can index them directly (read-only worksheets stop at their last row).
+    
+    Args:
+        ws: Worksheet to read
+        max_row: Number of rows to read
+        max_col: Number of columns to read
+        
+    Returns:
+        List of `max_row` tuples, each with `max_col` values
+    """
+    empty_row = (None,) * max_col
+    rows = [
+        tuple(values) + empty_row[len(values):]
+        for values in ws.iter_rows(min_row=1, max_row=max_row, max_col=max_col, values_only=True)
+    ]
+    rows.extend([empty_row] * (max_row - len(rows)))
+    return rows
+
+
+@functools.lru_cache(maxsize=256)
 def _is_metadata_label(text: str) -> bool:
     """Check if text appears to be a metadata label rather than a title.
     
@@ -245,6 +320,7 @@ def _is_metadata_label(text: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=256)
 def _is_likely_title(text: str) -> bool:
     """Check if text appears to be a schedule title.
     
@@ -263,47 +339,33 @@ def _is_likely_title(text: str) -> bool:
     if not text or len(text) < 3:
         return False
     
-    if _is_metadata_label(text):
+    # Cheap structural rejections first: formulas (start with =) and error
+    # values (e.g. "#REF!")
+    if text.startswith('=') or (text.startswith('#') and text.endswith('!')):
         return False
     
-    # Check for formula (starts with =)
-    if text.startswith('='):
-        return False
-    
-    # Check for error values
-    if text.startswith('#') and text.endswith('!'):
+    if _is_metadata_label(text):
         return False
     
     # Titles often contain these patterns
     text_lower = text.lower()
-    title_indicators = ['schedule', 'project', 'interior', 'finish', 'ff&e', 'ffe']
 
     # If it contains a title indicator, it's likely a title
-    if any(indicator in text_lower for indicator in title_indicators):
+    if _TITLE_INDICATOR_RE.search(text_lower):
         return True
 
     # Disclaimers and instruction blocks are not titles (common above headers).
     if "\n" in text:
         return False
-    disclaimer_indicators = [
-        "refer to drawings",
-        "refer to plans",
-        "for full detail",
-        "images and costs",
-        "verify on site",
-        "prior to order",
-        "indicative only",
-        "all dimensions",
-    ]
-    if any(indicator in text_lower for indicator in disclaimer_indicators):
+    if _DISCLAIMER_RE.search(text_lower):
         return False
 
     # Avoid mistaking column headers (e.g., "Indicative Image") for titles.
     # If it's a short phrase with no title indicators, no digits, and no colon,
-    # treat it as a header/label rather than a schedule name.
-    if ":" not in text and not re.search(r"\d", text):
-        words = re.findall(r"[A-Za-z&]+", text)
-        if 1 <= len(words) <= 3 and len(text) <= 28:
+    # treat it as a header/label rather than a schedule name. The length test
+    # runs first so longer text never reaches the regex scans.
+    if ":" not in text and len(text) <= 28 and not _HAS_DIGIT_RE.search(text):
+        if 1 <= len(_WORD_RE.findall(text)) <= 3:
             return False
     
     # If it contains a colon followed by text (like "12006: GEM, WATERLINE PLACE")
@@ -319,7 +381,7 @@ def _is_likely_title(text: str) -> bool:
     return False
 
 
-def _resolve_cover_sheet_formula(wb: Workbook, formula: str) -> str | None:
+def _resolve_cover_sheet_formula(wb: "Workbook", formula: str) -> str | None:
     """Attempt to resolve a formula reference to Cover Sheet.
     
     Args:
@@ -329,18 +391,15 @@ def _resolve_cover_sheet_formula(wb: Workbook, formula: str) -> str | None:
     Returns:
         Resolved cell value or None if cannot resolve
     """
-    match = COVER_SHEET_FORMULA_PATTERN.match(formula)
+    match = FORMULA_PATTERN.match(formula)
     if not match:
-        # Try generic formula pattern
-        match = FORMULA_PATTERN.match(formula)
-        if not match:
-            return None
-        sheet_name = match.group(1).strip()
-    else:
-        sheet_name = 'Cover Sheet'
+        return None
     
-    col_letter = match.group(1) if COVER_SHEET_FORMULA_PATTERN.match(formula) else match.group(2)
-    row_num = int(match.group(2) if COVER_SHEET_FORMULA_PATTERN.match(formula) else match.group(3))
+    sheet_name, col_letter, row_text = match.groups()
+    sheet_name = sheet_name.strip()
+    if COVER_SHEET_NAME_PATTERN.fullmatch(sheet_name):
+        sheet_name = 'Cover Sheet'
+    row_num = int(row_text)
     
     # Find the Cover Sheet (case-insensitive, handle trailing spaces)
     cover_sheet = None
@@ -355,7 +414,7 @@ def _resolve_cover_sheet_formula(wb: Workbook, formula: str) -> str | None:
     # Get the referenced cell value
     try:
         cell = cover_sheet[f"{col_letter}{row_num}"]
-        value = _get_cell_string_value(cell)
+        value = _cell_text(cell.value)
         if value and _is_likely_title(value):
             return _clean_schedule_name(value)
     except (KeyError, ValueError):
@@ -364,7 +423,7 @@ def _resolve_cover_sheet_formula(wb: Workbook, formula: str) -> str | None:
     return None
 
 
-def _find_schedule_name_in_cover_sheet(wb: Workbook) -> str | None:
+def _find_schedule_name_in_cover_sheet(wb: "Workbook") -> str | None:
     """Search for schedule name in a Cover Sheet.
     
     Looks for patterns like:
@@ -388,19 +447,19 @@ def _find_schedule_name_in_cover_sheet(wb: Workbook) -> str | None:
     if cover_sheet is None:
         return None
     
+    rows = _read_top_rows(cover_sheet)
+    
     # Scan first 10 rows for schedule name patterns
-    for row_idx in range(1, 11):
+    for raw_a, raw_b in rows:
         # Check for "SCHEDULE NAME" label pattern
-        cell_a = cover_sheet.cell(row=row_idx, column=1)
-        val_a = _get_cell_string_value(cell_a)
+        val_a = _cell_text(raw_a)
         
         if val_a:
             val_a_lower = val_a.lower().strip()
             
             # Pattern: "SCHEDULE NAME" in A, actual name in B
             if 'schedule name' in val_a_lower or val_a_lower == 'schedule':
-                cell_b = cover_sheet.cell(row=row_idx, column=2)
-                val_b = _get_cell_string_value(cell_b)
+                val_b = _cell_text(raw_b)
                 if val_b and len(val_b) > 2:
                     return _clean_schedule_name(val_b)
             
@@ -409,18 +468,14 @@ def _find_schedule_name_in_cover_sheet(wb: Workbook) -> str | None:
                 return _clean_schedule_name(val_a)
     
     # Check A6 specifically (common location in sample2)
-    try:
-        cell_a6 = cover_sheet.cell(row=6, column=1)
-        val_a6 = _get_cell_string_value(cell_a6)
-        if val_a6 and _is_likely_title(val_a6):
-            return _clean_schedule_name(val_a6)
-    except (KeyError, ValueError):
-        pass
+    val_a6 = _cell_text(rows[5][0])
+    if val_a6 and _is_likely_title(val_a6):
+        return _clean_schedule_name(val_a6)
     
     return None
 
 
-def get_schedule_name(wb: Workbook, filename: str) -> str:
+def get_schedule_name(wb: "Workbook", filename: str) -> str:
     """Extract the schedule name from a workbook.
     
     This function attempts to find the schedule name using multiple strategies:
@@ -451,10 +506,9 @@ def get_schedule_name(wb: Workbook, filename: str) -> str:
     
     # Strategy 1: Check rows 1-10 of first sheet for title text
     project_title_candidate: str | None = None
-    for row_idx in range(1, 11):
+    for raw_a, raw_b in _read_top_rows(first_sheet):
         # Check column A first
-        cell_a = first_sheet.cell(row=row_idx, column=1)
-        val_a = _get_cell_string_value(cell_a)
+        val_a = _cell_text(raw_a)
         
         if val_a:
             # Check if it's a formula reference
@@ -478,14 +532,12 @@ def get_schedule_name(wb: Workbook, filename: str) -> str:
             # Check for "SCHEDULE NAME" label pattern
             val_a_lower = val_a.lower().strip()
             if 'schedule name' in val_a_lower or val_a_lower == 'schedule':
-                cell_b = first_sheet.cell(row=row_idx, column=2)
-                val_b = _get_cell_string_value(cell_b)
+                val_b = _cell_text(raw_b)
                 if val_b and len(val_b) > 2:
                     return _clean_schedule_name(val_b)
         
         # Also check column B for titles (some formats put title there)
-        cell_b = first_sheet.cell(row=row_idx, column=2)
-        val_b = _get_cell_string_value(cell_b)
+        val_b = _cell_text(raw_b)
         if val_b and _is_likely_title(val_b):
             # Make sure column A isn't a label
             if not val_a or not _is_metadata_label(val_a):
@@ -517,12 +569,12 @@ def _filename_to_schedule_name(filename: str) -> str:
     if not filename:
         return "Unknown Schedule"
     
-    # Remove common extensions
+    # Remove common extensions (case-insensitive). rpartition rather than
+    # os.path.splitext, which keeps a bare ".xlsx" as the name.
     name = filename
-    for ext in ['.xlsx', '.xls', '.XLSX', '.XLS']:
-        if name.endswith(ext):
-            name = name[:-len(ext)]
-            break
+    root, dot, ext = filename.rpartition('.')
+    if dot and ext.lower() in ('xlsx', 'xls'):
+        name = root
     
     # Clean up underscores and extra spaces
     name = name.replace('_', ' ').strip()
@@ -534,6 +586,39 @@ def _filename_to_schedule_name(filename: str) -> str:
     return name
 
 
+# Header-like cell values used to spot header rows repeated mid-sheet. A row
+# must have a doc_code header cell plus at least 2 of the (column, value) cells.
+_REPEATED_HEADER_DOC_CODES = frozenset({
+    "spec code", "doc code", "drawing code", "code", "ref", "ref no", "reference",
+    "id", "sku", "item code", "product code",
+})
+
+_REPEATED_HEADER_CANDIDATES: dict[str, frozenset[str]] = {
+    "item_location": frozenset({"item & location", "item and location", "area", "room", "location", "description"}),
+    "specs": frozenset({"specification", "specifications", "specs", "notes/comments", "details", "spec"}),
+    "manufacturer": frozenset({"manufacturer", "supplier", "brand", "vendor", "maker", "manufacturer / supplier"}),
+    "notes": frozenset({"notes", "comments", "remarks"}),
+    "qty": frozenset({"qty", "quantity", "units", "no.", "no"}),
+    "cost": frozenset({"cost", "rrp", "price", "indicative cost", "cost per unit", "unit price", "unit cost", "$"}),
+}
+
+_REPEATED_HEADER_CELLS = frozenset(
+    (key, value) for key, values in _REPEATED_HEADER_CANDIDATES.items() for value in values
+)
+
+# Product fields of which at least one must be set for a row to be kept
+_MEANINGFUL_FIELDS = operator.attrgetter(
+    "doc_code",
+    "product_name",
+    "brand",
+    "colour",
+    "finish",
+    "material",
+    "product_description",
+    "product_details",
+)
+
+
 def _looks_like_repeated_header_row(row_data: dict[str, Any]) -> bool:
     """Heuristic to skip header rows repeated mid-sheet.
 
@@ -541,55 +626,21 @@ def _looks_like_repeated_header_row(row_data: dict[str, Any]) -> bool:
     middle of a sheet (e.g., after a page break). The row extractor treats these
     as potential product rows, so we filter them out here.
     """
-
-    def norm(value: Any) -> str:
-        if value is None:
-            return ""
-        return str(value).strip().lower()
-
-    doc_code = norm(row_data.get("doc_code"))
-    if not doc_code:
-        return False
-
     # Must look like a header cell for the doc_code column, plus at least 2 other
     # header-like cells in common columns.
-    doc_code_headers = {
-        "spec code",
-        "doc code",
-        "drawing code",
-        "code",
-        "ref",
-        "ref no",
-        "reference",
-        "id",
-        "sku",
-        "item code",
-        "product code",
-    }
-    if doc_code not in doc_code_headers:
+    doc_code = row_data.get("doc_code")
+    if doc_code is None or str(doc_code).strip().lower() not in _REPEATED_HEADER_DOC_CODES:
         return False
 
     headerish = 0
-    candidates: dict[str, set[str]] = {
-        "item_location": {"item & location", "item and location", "area", "room", "location", "description"},
-        "specs": {"specification", "specifications", "specs", "notes/comments", "details", "spec"},
-        "manufacturer": {"manufacturer", "supplier", "brand", "vendor", "maker", "manufacturer / supplier"},
-        "notes": {"notes", "comments", "remarks"},
-        "qty": {"qty", "quantity", "units", "no.", "no"},
-        "cost": {"cost", "rrp", "price", "indicative cost", "cost per unit", "unit price", "unit cost", "$"},
-    }
-    for key, values in candidates.items():
-        if norm(row_data.get(key)) in values:
+    for key in _REPEATED_HEADER_CANDIDATES:
+        value = row_data.get(key)
+        if value is not None and (key, str(value).strip().lower()) in _REPEATED_HEADER_CELLS:
             headerish += 1
+            if headerish >= 2:
+                return True
 
-    return headerish >= 2
-
-
-def _normalize_doc_code_for_dedup(doc_code: str | None) -> str | None:
-    if doc_code is None:
-        return None
-    normalized = doc_code.strip()
-    return normalized or None
+    return False
 
 
 def _dedupe_products_by_doc_code(products: list["Product"]) -> list["Product"]:
@@ -605,8 +656,8 @@ def _dedupe_products_by_doc_code(products: list["Product"]) -> list["Product"]:
     deduped: list["Product"] = []
 
     for product in products:
-        doc_code_key = _normalize_doc_code_for_dedup(product.doc_code)
-        if doc_code_key is None:
+        doc_code_key = product.doc_code.strip() if product.doc_code else ""
+        if not doc_code_key:
             deduped.append(product)
             continue
         if doc_code_key in seen:
@@ -617,7 +668,7 @@ def _dedupe_products_by_doc_code(products: list["Product"]) -> list["Product"]:
     return deduped
 
 
-def parse_workbook(wb: Workbook, filename: str, extract_images: bool = False) -> "ParseResponse":
+def parse_workbook(wb: "Workbook", filename: str, extract_images: bool = False) -> "ParseResponse":
     """Parse an openpyxl workbook into a structured API response.
 
     Orchestrates the full parsing pipeline:
@@ -645,8 +696,6 @@ def parse_workbook(wb: Workbook, filename: str, extract_images: bool = False) ->
     schedule_name = get_schedule_name(wb, filename)
     products: list["Product"] = []
 
-    schedule_supporting = {"item_location", "specs", "manufacturer", "notes", "qty", "cost", "product_name"}
-
     for sheet_name in wb.sheetnames:
         ws = wb[sheet_name]
 
@@ -662,7 +711,7 @@ def parse_workbook(wb: Workbook, filename: str, extract_images: bool = False) ->
         col_map = map_columns(ws, header_row=header_row)
         if "doc_code" not in col_map and "product_name" not in col_map:
             continue
-        if not (set(col_map.keys()) & schedule_supporting):
+        if _SCHEDULE_SUPPORTING_COLUMNS.isdisjoint(col_map):
             continue
 
         for row_data in iter_product_rows(ws, header_row=header_row, col_map=col_map):
@@ -673,18 +722,7 @@ def parse_workbook(wb: Workbook, filename: str, extract_images: bool = False) ->
             kv_manufacturer = parse_kv_block(row_data.get("manufacturer"))
 
             product = extract_product_fields(row_data, kv_specs, kv_manufacturer)
-            if not any(
-                (
-                    product.doc_code,
-                    product.product_name,
-                    product.brand,
-                    product.colour,
-                    product.finish,
-                    product.material,
-                    product.product_description,
-                    product.product_details,
-                )
-            ):
+            if not any(_MEANINGFUL_FIELDS(product)):
                 continue
 
             products.append(product)
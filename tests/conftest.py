@@ -5,38 +5,53 @@ from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
+from openpyxl import Workbook
 
 from app.main import create_app
+from app.parser.workbook import load_workbook_safe
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client() -> Iterator[TestClient]:
     app = create_app()
     with TestClient(app) as test_client:
         yield test_client
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def repo_root() -> Path:
     return Path(__file__).resolve().parent.parent
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample1_path(repo_root: Path) -> Path:
     return repo_root / "data" / "schedule_sample1.xlsx"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample2_path(repo_root: Path) -> Path:
     return repo_root / "data" / "schedule_sample2.xlsx"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample3_path(repo_root: Path) -> Path:
     return repo_root / "data" / "schedule_sample3.xlsx"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def sample_bytes(sample1_path: Path, sample2_path: Path, sample3_path: Path) -> dict[Path, bytes]:
+    return {path: path.read_bytes() for path in (sample1_path, sample2_path, sample3_path)}
+
+
+@pytest.fixture(scope="session")
+def sample_workbooks(sample_bytes: dict[Path, bytes]) -> Iterator[dict[Path, Workbook]]:
+    workbooks = {path: load_workbook_safe(data, read_only=True) for path, data in sample_bytes.items()}
+    yield workbooks
+    for wb in workbooks.values():
+        wb.close()
+
+
+@pytest.fixture(scope="session")
 def synthetic_generated_dir(repo_root: Path) -> Path:
     path = repo_root / "synthetic_out" / "generated"
     if not path.exists():
@@ -44,7 +59,7 @@ def synthetic_generated_dir(repo_root: Path) -> Path:
     return path
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def synthetic_mutated_dir(repo_root: Path) -> Path:
     path = repo_root / "synthetic_out" / "mutated"
     if not path.exists():
@@ -52,7 +67,7 @@ def synthetic_mutated_dir(repo_root: Path) -> Path:
     return path
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def generated_files(synthetic_generated_dir: Path) -> list[tuple[Path, Path]]:
     pairs: list[tuple[Path, Path]] = []
     for xlsx_path in sorted(synthetic_generated_dir.glob("*.xlsx")):
@@ -64,7 +79,7 @@ def generated_files(synthetic_generated_dir: Path) -> list[tuple[Path, Path]]:
     return pairs
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mutated_files(synthetic_mutated_dir: Path) -> list[tuple[Path, Path]]:
     pairs: list[tuple[Path, Path]] = []
     for xlsx_path in sorted(synthetic_mutated_dir.glob("*.xlsx")):
@@ -76,7 +91,7 @@ def mutated_files(synthetic_mutated_dir: Path) -> list[tuple[Path, Path]]:
     return pairs
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def all_synthetic_files(
     generated_files: list[tuple[Path, Path]],
     mutated_files: list[tuple[Path, Path]],
@@ -10,16 +10,17 @@ from app.core.models import ParseResponse
 
 
 def post_parse(client: TestClient, xlsx_path: Path) -> dict[str, Any]:
-    response = client.post(
-        "/parse",
-        files={
-            "file": (
-                xlsx_path.name,
-                xlsx_path.read_bytes(),
-                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            )
-        },
-    )
+    with xlsx_path.open("rb") as fh:
+        response = client.post(
+            "/parse",
+            files={
+                "file": (
+                    xlsx_path.name,
+                    fh,
+                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                )
+            },
+        )
     assert response.headers.get("content-type", "").startswith("application/json")
     assert response.status_code == 200, f"{xlsx_path.name}: {response.text[:400]}"
     data = response.json()
@@ -34,25 +35,21 @@ def validate_schema(data: dict[str, Any]) -> ParseResponse:
 
 
 def load_json(path: Path) -> dict[str, Any]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(path.read_bytes())
     assert isinstance(data, dict), f"{path.name}: expected JSON object"
     return data
 
 
 def iter_string_values(value: Any) -> list[str]:
-    if value is None:
-        return []
-    if isinstance(value, str):
-        return [value]
-    if isinstance(value, list):
-        out: list[str] = []
-        for item in value:
-            out.extend(iter_string_values(item))
-        return out
-    if isinstance(value, dict):
-        out = []
-        for item in value.values():
-            out.extend(iter_string_values(item))
-        return out
-    return []
-
+    out: list[str] = []
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is str:
+            out.append(item)
+        elif item_type is list:
+            stack.extend(reversed(item))
+        elif item_type is dict:
+            stack.extend(reversed(list(item.values())))
+    return out
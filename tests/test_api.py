@@ -17,13 +17,13 @@ from typing import Any
 from fastapi.testclient import TestClient
 
 
-def _post_parse(client: TestClient, xlsx_path: Path) -> Any:
+def _post_parse(client: TestClient, xlsx_path: Path, sample_bytes: dict[Path, bytes]) -> Any:
     response = client.post(
         "/parse",
         files={
             "file": (
                 xlsx_path.name,
-                xlsx_path.read_bytes(),
+                sample_bytes[xlsx_path],
                 "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             )
         },
@@ -45,8 +45,10 @@ def test_health_returns_ok(client: TestClient) -> None:
     assert response.json() == {"status": "ok"}
 
 
-def test_parse_sample1_returns_valid_json(client: TestClient, sample1_path: Path) -> None:
-    response = _post_parse(client, sample1_path)
+def test_parse_sample1_returns_valid_json(
+    client: TestClient, sample1_path: Path, sample_bytes: dict[Path, bytes]
+) -> None:
+    response = _post_parse(client, sample1_path, sample_bytes)
     assert response.status_code == 200
 
     data = response.json()
@@ -65,8 +67,10 @@ def test_parse_sample1_returns_valid_json(client: TestClient, sample1_path: Path
     assert iconic.get("width") == 3660
 
 
-def test_parse_sample2_returns_valid_json(client: TestClient, sample2_path: Path) -> None:
-    response = _post_parse(client, sample2_path)
+def test_parse_sample2_returns_valid_json(
+    client: TestClient, sample2_path: Path, sample_bytes: dict[Path, bytes]
+) -> None:
+    response = _post_parse(client, sample2_path, sample_bytes)
     assert response.status_code == 200
 
     data = response.json()
@@ -86,8 +90,10 @@ def test_parse_sample2_returns_valid_json(client: TestClient, sample2_path: Path
     assert blink.get("height") == 600
 
 
-def test_parse_sample3_returns_valid_json(client: TestClient, sample3_path: Path) -> None:
-    response = _post_parse(client, sample3_path)
+def test_parse_sample3_returns_valid_json(
+    client: TestClient, sample3_path: Path, sample_bytes: dict[Path, bytes]
+) -> None:
+    response = _post_parse(client, sample3_path, sample_bytes)
     assert response.status_code == 200
 
     data = response.json()
@@ -139,6 +145,21 @@ def test_parse_rejects_invalid_xlsx_bytes(client: TestClient) -> None:
     assert data["error"] in {"Invalid file", "Invalid file format", "Invalid Excel file", "Failed to load workbook"}
 
 
+def test_parse_rejects_large_non_zip_bytes(client: TestClient) -> None:
+    response = client.post(
+        "/parse",
+        files={
+            "file": (
+                "bad.xlsx",
+                b"not a zip archive " * 64,
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            )
+        },
+    )
+    assert response.status_code == 400
+    assert response.json().get("error") == "Invalid file format"
+
+
 def test_parse_missing_file_returns_422(client: TestClient) -> None:
     response = client.post("/parse")
     assert response.status_code == 422
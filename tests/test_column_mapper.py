@@ -50,6 +50,12 @@ class TestNormalizeHeader:
         """Test numeric input is converted to string."""
         assert _normalize_header(123) == "123"
 
+    def test_equal_numbers_of_different_types_not_conflated(self):
+        """Test cached normalization keeps int, float and bool inputs apart."""
+        assert _normalize_header(1) == "1"
+        assert _normalize_header(1.0) == "1.0"
+        assert _normalize_header(True) == "true"
+
     def test_trailing_punctuation(self):
         """Test trailing punctuation is removed."""
         assert _normalize_header("Notes:") == "notes"
@@ -86,6 +92,11 @@ class TestExactMatch:
         # Should match "notes" not "code"
         assert result == "notes"
 
+    def test_longest_partial_match_wins(self):
+        """Test the longest synonym wins regardless of its position."""
+        assert _exact_match("code / product description") == "item_location"
+        assert _exact_match("qty. required") == "qty"
+
 
 class TestFuzzyMatch:
     """Tests for _fuzzy_match function."""
@@ -176,6 +187,20 @@ class TestMapColumns:
         # First occurrence (CODE at column 1) should be kept
         assert columns['doc_code'] == 1
 
+    def test_all_canonical_columns_bound(self):
+        """Test a header row covering every canonical column maps each once."""
+        wb = Workbook()
+        ws = wb.active
+        
+        canonicals = get_canonical_columns()
+        for col, canonical in enumerate(canonicals, start=1):
+            ws.cell(row=1, column=col, value=get_synonyms(canonical)[0].upper())
+        ws.cell(row=1, column=len(canonicals) + 1, value='CODE')
+        
+        columns = map_columns(ws, header_row=1, max_cols=50)
+        
+        assert columns == {canonical: col for col, canonical in enumerate(canonicals, start=1)}
+
     def test_empty_cells_skipped(self):
         """Test that empty cells are skipped."""
         wb = Workbook()
@@ -7,6 +7,7 @@ Tests the key-value block parsing functionality including:
 """
 
 import pytest
+from app.core.models import Product
 from app.parser.field_parser import (
     parse_kv_block,
     parse_kv_with_multivalue,
@@ -644,3 +645,22 @@ COLOUR: Black"""
         assert product.qty == 2
         assert product.rrp == 100.0
         assert product.product_description == "LIVING"
+
+    def test_unvalidated_product_matches_validated_model(self):
+        kv_specs = parse_kv_block(
+            """PRODUCT: SAMPLE
+SIZE: 600 W X 1200 L MM"""
+        )
+        row_data = {
+            "doc_code": "T2",
+            "qty": 3,
+            "cost": 100,
+            "height": 18.0,
+            "detail_rows": [],
+        }
+
+        product = extract_product_fields(row_data=row_data, kv_specs=kv_specs, kv_manufacturer={})
+
+        assert type(product.rrp) is float
+        assert type(product.height) is int
+        assert Product.model_validate(product.model_dump()) == product
@@ -1,56 +1,76 @@
-from app.parser.normalizers import parse_dimensions, parse_price
+from app.parser.normalizers import Dims, parse_dimensions, parse_mm_value, parse_price
 
 
 class TestParseDimensions:
     def test_none_input(self):
-        assert parse_dimensions(None) == {"width": None, "length": None, "height": None}
+        assert parse_dimensions(None) == Dims(None, None, None)
 
     def test_explicit_width_mm_no_conversion(self):
         dims = parse_dimensions("WIDTH: 600 MM")
-        assert dims["width"] == 600
-        assert dims["length"] is None
-        assert dims["height"] is None
+        assert dims.width == 600
+        assert dims.length is None
+        assert dims.height is None
 
     def test_explicit_width_metres(self):
-        assert parse_dimensions("WIDTH: 3.66 METRES")["width"] == 3660
+        assert parse_dimensions("WIDTH: 3.66 METRES").width == 3660
 
     def test_explicit_width_m_unit(self):
-        assert parse_dimensions("WIDTH: 3.66 m")["width"] == 3660
+        assert parse_dimensions("WIDTH: 3.66 m").width == 3660
 
     def test_wxh_labeled_mm(self):
         dims = parse_dimensions("600 W X 600 H MM")
-        assert dims["width"] == 600
-        assert dims["height"] == 600
+        assert dims.width == 600
+        assert dims.height == 600
 
     def test_wxl_labeled_mm_with_noise(self):
         dims = parse_dimensions("SIZE - GRANDE BOARD - 220 W X 2200 L MM")
-        assert dims["width"] == 220
-        assert dims["length"] == 2200
+        assert dims.width == 220
+        assert dims.length == 2200
 
     def test_sheet_size_unlabeled(self):
         dims = parse_dimensions("SHEET SIZE MAX: 5500 X 2800 MM")
-        assert dims["width"] == 5500
-        assert dims["length"] == 2800
+        assert dims.width == 5500
+        assert dims.length == 2800
 
     def test_parenthesized_labels(self):
         dims = parse_dimensions("1200 (W) x 800 (D) x 330 (H) mm")
-        assert dims["width"] == 1200
-        assert dims["length"] == 800
-        assert dims["height"] == 330
+        assert dims.width == 1200
+        assert dims.length == 800
+        assert dims.height == 330
 
     def test_thickness_maps_to_height(self):
         dims = parse_dimensions("THICKNESS: 10MM")
-        assert dims["height"] == 10
+        assert dims.height == 10
 
     def test_cm_conversion(self):
         dims = parse_dimensions("WIDTH: 60 CM")
-        assert dims["width"] == 600
+        assert dims.width == 600
 
     def test_three_part_unlabeled(self):
         dims = parse_dimensions("1200 X 800 X 330 MM")
-        assert dims["width"] == 1200
-        assert dims["length"] == 800
-        assert dims["height"] == 330
+        assert dims.width == 1200
+        assert dims.length == 800
+        assert dims.height == 330
+
+    def test_explicit_keys_first_occurrence_wins(self):
+        dims = parse_dimensions("WIDTH: 600\nHEIGHT: 20 MM\nWIDTH: 900")
+        assert dims.width == 600
+        assert dims.height == 20
+
+    def test_multiplication_sign_variants(self):
+        for sep in ("×", "✕", "⨯", "Ｘ"):
+            dims = parse_dimensions(f"5500 {sep} 2800 MM")
+            assert dims.width == 5500, sep
+            assert dims.length == 2800, sep
+
+    def test_fullwidth_digits(self):
+        dims = parse_dimensions("WIDTH: ６００ MM")
+        assert dims.width == 600
+
+    def test_non_breaking_space(self):
+        dims = parse_dimensions("600\u00a0W X 600\u00a0H MM")
+        assert dims.width == 600
+        assert dims.height == 600
 
 
 class TestParsePrice:
@@ -81,3 +101,20 @@ class TestParsePrice:
 
     def test_avoids_unrelated_numbers(self):
         assert parse_price("SIZE: 600 X 600 MM") is None
+
+    def test_multiplication_sign_after_keyword(self):
+        assert parse_price("Price×2") == 2.0
+        assert parse_price("price×600 each") == 600.0
+
+
+class TestParseMmValue:
+    def test_units(self):
+        assert parse_mm_value("1200 mm") == 1200
+        assert parse_mm_value("2.4m") == 2400
+
+    def test_fullwidth_digits(self):
+        assert parse_mm_value("１２００mm") == 1200
+
+    def test_trailing_multiplication_sign(self):
+        assert parse_mm_value("2.4m×") == 2400
+        assert parse_mm_value('600"× 1200') == 15240
@@ -10,6 +10,7 @@ Verifies the following requirements from tasks.md 2.5:
 - Schedule name extracted correctly (not formula string)
 """
 
+import io
 import json
 import pytest
 from pathlib import Path
@@ -30,6 +31,24 @@ from app.parser.merged_cells import (
 )
 
 
+@pytest.fixture(scope="module")
+def sample1_workbook(sample_bytes, sample1_path):
+    """Load sample1 once for this module."""
+    return load_workbook_safe(sample_bytes[sample1_path])
+
+
+@pytest.fixture(scope="module")
+def sample2_workbook(sample_bytes, sample2_path):
+    """Load sample2 once for this module."""
+    return load_workbook_safe(sample_bytes[sample2_path])
+
+
+@pytest.fixture(scope="module")
+def sample3_workbook(sample_bytes, sample3_path):
+    """Load sample3 once for this module."""
+    return load_workbook_safe(sample_bytes[sample3_path])
+
+
 class TestPhase2VerificationSample1:
     """Verification tests for Sample1 (schedule_sample1.xlsx).
 
@@ -39,10 +58,9 @@ class TestPhase2VerificationSample1:
     """
 
     @pytest.fixture
-    def workbook(self):
-        """Load sample1 workbook."""
-        with open('data/schedule_sample1.xlsx', 'rb') as f:
-            return load_workbook_safe(f.read())
+    def workbook(self, sample1_workbook):
+        """Sample1 workbook shared across the module (tests must not mutate it)."""
+        return sample1_workbook
 
     def test_apartments_sheet_exists(self, workbook):
         """Verify APARTMENTS sheet exists in the workbook."""
@@ -102,9 +120,10 @@ class TestPhase2VerificationSample1:
         assert not name.startswith('=')
         assert 'schedule_sample1' not in name.lower()
 
-    def test_merged_cells_filled(self, workbook):
+    def test_merged_cells_filled(self, sample_bytes, sample1_path):
         """Verify merged cells can be filled without errors."""
-        ws = workbook['APARTMENTS']
+        # Filling unmerges the sheet, so use a private copy of the workbook
+        ws = load_workbook_safe(sample_bytes[sample1_path])['APARTMENTS']
 
         # Count merged cells before
         merged_before = len(ws.merged_cells.ranges)
@@ -128,10 +147,9 @@ class TestPhase2VerificationSample2:
     """
 
     @pytest.fixture
-    def workbook(self):
-        """Load sample2 workbook."""
-        with open('data/schedule_sample2.xlsx', 'rb') as f:
-            return load_workbook_safe(f.read())
+    def workbook(self, sample2_workbook):
+        """Sample2 workbook shared across the module (tests must not mutate it)."""
+        return sample2_workbook
 
     def test_all_sheets_exist(self, workbook):
         """Verify all expected sheets exist."""
@@ -216,10 +234,9 @@ class TestPhase2VerificationSample3:
     """
 
     @pytest.fixture
-    def workbook(self):
-        """Load sample3 workbook."""
-        with open('data/schedule_sample3.xlsx', 'rb') as f:
-            return load_workbook_safe(f.read())
+    def workbook(self, sample3_workbook):
+        """Sample3 workbook shared across the module (tests must not mutate it)."""
+        return sample3_workbook
 
     def test_schedule_sheet_exists(self, workbook):
         """Verify Schedule sheet exists."""
@@ -266,9 +283,10 @@ class TestPhase2VerificationSample3:
         assert 'schedule' in name.lower()
         assert 'sample3' in name.lower() or 'sample 3' in name.lower()
 
-    def test_many_merged_cells_handled(self, workbook):
+    def test_many_merged_cells_handled(self, sample_bytes, sample3_path):
         """Verify large number of merged cells is handled efficiently."""
-        ws = workbook['Schedule']
+        # Filling unmerges the sheet, so use a private copy of the workbook
+        ws = load_workbook_safe(sample_bytes[sample3_path])['Schedule']
 
         # Sample3 has many merged cells (1234+)
         merged_count = len(ws.merged_cells.ranges)
@@ -481,6 +499,16 @@ class TestPhase2VerificationSummary:
                 wb = load_workbook_safe(f.read())
             assert wb is not None, f"Failed to load {sample_path}"
 
+    def test_load_from_file_object(self):
+        """Verify workbooks load from an open binary file as well as bytes."""
+        with open('data/schedule_sample1.xlsx', 'rb') as f:
+            f.seek(10)  # loading always starts from the beginning
+            wb = load_workbook_safe(f)
+        assert wb.sheetnames == ['APARTMENTS']
+
+        with pytest.raises(WorkbookLoadError, match="Empty file"):
+            load_workbook_safe(io.BytesIO())
+
     def test_phase2_requirements_matrix(self):
         """Comprehensive test of all Phase 2.5 requirements.
 
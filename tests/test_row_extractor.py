@@ -24,8 +24,10 @@ from app.parser.row_extractor import (
     _is_item_row,
     _is_empty_row,
     _has_item_key,
-    _get_cell_value,
+    _materialize_rows,
     _normalize_text,
+    _classify_row,
+    RowKind,
 )
 
 
@@ -34,6 +36,16 @@ DATA_DIR = Path(__file__).parent.parent / "data"
 SYNTHETIC_DIR = Path(__file__).parent.parent / "synthetic_out" / "generated"
 
 
+def _row_values(ws, row):
+    """Materialize a single worksheet row as a value tuple."""
+    return _materialize_rows(ws, row, row, ws.max_column)[0]
+
+
+def _data_rows(ws, header_row):
+    """Materialize all rows below the header row as value tuples."""
+    return _materialize_rows(ws, header_row + 1, ws.max_row, ws.max_column)
+
+
 class TestNormalizeText:
     """Tests for _normalize_text helper function."""
     
@@ -72,7 +84,7 @@ class TestSample1SingleRowLayout:
     def test_layout_detection(self, sample1_data):
         """Test that sample1 is detected as single-row layout."""
         ws, header_row, col_map = sample1_data
-        layout = _detect_layout_type(ws, header_row, col_map)
+        layout = _detect_layout_type(_data_rows(ws, header_row), col_map)
         assert layout == "single"
     
     def test_header_row_detection(self, sample1_data):
@@ -135,7 +147,7 @@ class TestSample2SingleRowLayout:
     def test_layout_detection(self, sample2_data):
         """Test that sample2 is detected as single-row layout."""
         ws, header_row, col_map = sample2_data
-        layout = _detect_layout_type(ws, header_row, col_map)
+        layout = _detect_layout_type(_data_rows(ws, header_row), col_map)
         assert layout == "single"
     
     def test_header_row_detection(self, sample2_data):
@@ -175,7 +187,7 @@ class TestSample3GroupedLayout:
     def test_layout_detection(self, sample3_data):
         """Test that sample3 is detected as grouped layout."""
         ws, header_row, col_map = sample3_data
-        layout = _detect_layout_type(ws, header_row, col_map)
+        layout = _detect_layout_type(_data_rows(ws, header_row), col_map)
         assert layout == "grouped"
     
     def test_header_row_detection(self, sample3_data):
@@ -254,7 +266,7 @@ class TestIsDetailRow:
         """Test that a Maker: row is detected as detail row."""
         ws, col_map = sample3_ws
         # Row 13 has "Maker:" in column D
-        is_detail, key, value = _is_detail_row(ws, 13, col_map)
+        is_detail, key, value = _is_detail_row(_row_values(ws, 13), col_map)
         assert is_detail is True
         assert key.lower() == "maker"
         assert value == "Thomas Lentini"
@@ -263,7 +275,7 @@ class TestIsDetailRow:
         """Test that an Item: row is NOT detected as detail row."""
         ws, col_map = sample3_ws
         # Row 12 has "Item:" in column D
-        is_detail, key, value = _is_detail_row(ws, 12, col_map)
+        is_detail, key, value = _is_detail_row(_row_values(ws, 12), col_map)
         assert is_detail is False
 
 
@@ -283,7 +295,7 @@ class TestHasItemKey:
         """Test that an Item: row is detected."""
         ws = sample3_ws
         # Row 12 has "Item:" in column D
-        has_item, item_value = _has_item_key(ws, 12)
+        has_item, item_value = _has_item_key(_row_values(ws, 12))
         assert has_item is True
         assert item_value == "Coffee Table"
     
@@ -291,10 +303,33 @@ class TestHasItemKey:
         """Test that a detail row does not have Item: key."""
         ws = sample3_ws
         # Row 13 has "Maker:" not "Item:"
-        has_item, item_value = _has_item_key(ws, 13)
+        has_item, item_value = _has_item_key(_row_values(ws, 13))
         assert has_item is False
 
 
+class TestClassifyRow:
+    """Tests for _classify_row on plain row tuples."""
+    
+    def test_empty_row(self):
+        assert _classify_row((None, "  ", None), {"doc_code": 1}) == (RowKind.EMPTY, None)
+    
+    def test_section_row(self):
+        values = ("FLOORING",) * 7
+        assert _classify_row(values, {"doc_code": 1}) == (RowKind.SECTION, "FLOORING")
+    
+    def test_skip_row(self):
+        values = ("Delivery", None, None, None, "120")
+        assert _classify_row(values, {"doc_code": 1})[0] is RowKind.SKIP
+    
+    def test_item_row(self):
+        values = ("F64", "Lounge", None, "Item:", "Coffee Table")
+        assert _classify_row(values, {"doc_code": 1}) == (RowKind.ITEM, "Coffee Table")
+    
+    def test_detail_row(self):
+        values = ("F64", "Lounge", None, "Maker:", "Thomas Lentini")
+        assert _classify_row(values, {"doc_code": 1}) == (RowKind.DETAIL, ("maker", "Thomas Lentini"))
+
+
 class TestExtractAllProducts:
     """Tests for extract_all_products convenience function."""
     
@@ -353,6 +388,72 @@ class TestMaxRowsParameter:
         assert len(limited_products) <= 10
 
 
+class _NoWorksheet:
+    """Stand-in worksheet that fails on any access."""
+    
+    def __getattr__(self, name):
+        raise AssertionError(f"worksheet accessed: {name}")
+
+
+class TestPrematerializedRows:
+    """Tests for passing pre-materialized rows to iter_product_rows."""
+    
+    def test_rows_match_worksheet_iteration(self):
+        """Test that a values-only matrix yields the same products without touching ws."""
+        with open(DATA_DIR / "schedule_sample3.xlsx", "rb") as f:
+            wb = load_workbook_safe(f.read())
+        ws = wb["Schedule"]
+        fill_merged_regions(ws)
+        header_row = find_header_row(ws)
+        col_map = map_columns(ws, header_row)
+        
+        expected = list(iter_product_rows(ws, header_row, col_map))
+        rows = list(ws.iter_rows(values_only=True))
+        
+        assert list(iter_product_rows(_NoWorksheet(), header_row, col_map, rows=rows)) == expected
+
+
+class TestFlattenDetailMode:
+    """Tests for detail_mode='flatten' in grouped layout."""
+    
+    def _sample3_rows(self, detail_mode):
+        with open(DATA_DIR / "schedule_sample3.xlsx", "rb") as f:
+            wb = load_workbook_safe(f.read())
+        ws = wb["Schedule"]
+        fill_merged_regions(ws)
+        header_row = find_header_row(ws)
+        col_map = map_columns(ws, header_row)
+        return list(iter_product_rows(ws, header_row, col_map, detail_mode=detail_mode))
+    
+    def test_details_stored_in_mapping(self):
+        """Test that detail values go into 'details' without detail_rows."""
+        products = self._sample3_rows("flatten")
+        
+        assert products[0]["doc_code"] == "F64"
+        assert products[0]["details"]["maker"] == "Thomas Lentini"
+        assert products[0]["details"]["name"] == "Custom coffee table"
+        assert products[0]["detail_rows"] == []
+    
+    def test_flatten_keeps_every_detail(self):
+        """Test that every list-mode detail row also appears in flatten mode."""
+        listed = self._sample3_rows("list")
+        flattened = self._sample3_rows("flatten")
+        
+        assert len(listed) == len(flattened)
+        assert any(p["detail_rows"] for p in listed)
+        for list_row, flat_row in zip(listed, flattened):
+            for detail in list_row["detail_rows"]:
+                assert flat_row["details"][detail["key"]] == detail["value"]
+    
+    def test_flatten_does_not_shadow_mapped_columns(self):
+        """Test that a detail key matching a mapped column leaves the column alone."""
+        listed = self._sample3_rows("list")
+        flattened = self._sample3_rows("flatten")
+        
+        for list_row, flat_row in zip(listed, flattened):
+            assert flat_row["notes"] == list_row["notes"]
+
+
 @pytest.mark.synthetic
 class TestSyntheticFiles:
     """Tests using synthetic generated files."""
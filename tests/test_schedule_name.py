@@ -13,7 +13,6 @@ from app.parser.workbook import (
     _is_metadata_label,
     _is_likely_title,
     _filename_to_schedule_name,
-    _get_cell_string_value,
     _resolve_cover_sheet_formula,
     _find_schedule_name_in_cover_sheet,
 )
@@ -137,6 +136,7 @@ class TestFilenameToScheduleName:
         """Test that uppercase extensions are handled."""
         assert _filename_to_schedule_name('FILE.XLSX') == 'FILE'
         assert _filename_to_schedule_name('FILE.XLS') == 'FILE'
+        assert _filename_to_schedule_name('File.XlSx') == 'File'
 
     def test_no_extension(self):
         """Test filenames without extension."""
@@ -275,30 +275,37 @@ class TestGetScheduleNameWithWorkbook:
 class TestGetScheduleNameWithSampleFiles:
     """Integration tests with actual sample files."""
 
-    def test_sample1(self):
+    def test_sample1(self, sample_workbooks, sample1_path):
         """Test schedule name extraction from sample1."""
-        with open('data/schedule_sample1.xlsx', 'rb') as f:
-            wb = load_workbook_safe(f.read())
+        wb = sample_workbooks[sample1_path]
         
         result = get_schedule_name(wb, 'schedule_sample1.xlsx')
         assert result == '12006: GEM, WATERLINE PLACE, WILLIAMSTOWN'
 
-    def test_sample2(self):
+    def test_sample2(self, sample_workbooks, sample2_path):
         """Test schedule name extraction from sample2 (formula reference)."""
-        with open('data/schedule_sample2.xlsx', 'rb') as f:
-            wb = load_workbook_safe(f.read())
+        wb = sample_workbooks[sample2_path]
         
         result = get_schedule_name(wb, 'schedule_sample2.xlsx')
         assert result == 'SCHEDULE 003- INTERNAL FINISHES'
 
-    def test_sample3(self):
+    def test_sample3(self, sample_workbooks, sample3_path):
         """Test schedule name extraction from sample3 (fallback to filename)."""
-        with open('data/schedule_sample3.xlsx', 'rb') as f:
-            wb = load_workbook_safe(f.read())
+        wb = sample_workbooks[sample3_path]
         
         result = get_schedule_name(wb, 'schedule_sample3.xlsx')
         assert result == 'schedule sample3'
 
+    @pytest.mark.parametrize("name", ["schedule_sample1", "schedule_sample2", "schedule_sample3"])
+    def test_read_only_load_matches_full_load(self, name: str):
+        """Test schedule names are the same from a read-only load."""
+        with open(f'data/{name}.xlsx', 'rb') as f:
+            file_bytes = f.read()
+        
+        full = get_schedule_name(load_workbook_safe(file_bytes), f'{name}.xlsx')
+        streamed = get_schedule_name(load_workbook_safe(file_bytes, read_only=True), f'{name}.xlsx')
+        assert streamed == full
+
 
 class TestEdgeCases:
     """Edge case tests for schedule name extraction."""
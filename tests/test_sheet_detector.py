@@ -17,6 +17,7 @@ from app.parser.sheet_detector import (
     _normalize_header,
     _match_header,
     _score_row_as_header,
+    _locate_header,
 )
 from app.parser.workbook import load_workbook_safe
 
@@ -69,6 +70,11 @@ class TestMatchHeader:
         assert _match_header("item & location (see notes)") == "item_location"
         assert _match_header("manufacturer / supplier info") == "manufacturer"
 
+    def test_partial_match_prefers_longest_synonym(self):
+        """Test the longest contained synonym wins a partial match."""
+        # 'ref' (doc_code) is contained too, but 'specifications' is longer
+        assert _match_header("refer to specifications") == "specs"
+
     def test_no_match(self):
         """Test unrecognized headers return None."""
         assert _match_header("random text") is None
@@ -236,6 +242,22 @@ class TestFindHeaderRow:
         # Should find it with higher max_scan
         assert find_header_row(ws, max_scan=70) == 60
 
+    def test_confident_header_stops_scan(self):
+        """Test that a doc_code header with enough supporting columns wins immediately."""
+        wb = Workbook()
+        ws = wb.active
+        
+        ws['A2'] = 'CODE'
+        ws['B2'] = 'DESCRIPTION'
+        ws['C2'] = 'QTY'
+        ws['D2'] = 'COST'
+        
+        # A later row matching more columns is never reached
+        for col, text in enumerate(['CODE', 'IMAGE', 'DESCRIPTION', 'SPECS', 'BRAND', 'QTY', 'COST'], start=1):
+            ws.cell(row=8, column=col, value=text)
+        
+        assert find_header_row(ws) == 2
+
 
 class TestGetHeaderColumns:
     """Tests for get_header_columns function."""
@@ -289,6 +311,19 @@ class TestGetHeaderColumns:
         assert columns['item_location'] == 4
         assert len(columns) == 2
 
+    def test_matches_locate_header(self):
+        """Test that the single-pass header scan returns the same mapping."""
+        wb = Workbook()
+        ws = wb.active
+        
+        ws['A1'] = 'Project Title'
+        ws['A3'] = 'CODE'
+        ws['B3'] = 'DESCRIPTION'
+        ws['C3'] = 'CODE'
+        ws['D3'] = 'COST'
+        
+        assert _locate_header(ws) == (3, get_header_columns(ws, 3))
+
 
 class TestIsScheduleSheet:
     """Tests for is_schedule_sheet function."""